@@ -1,47 +1,235 @@
 """
 Data Collection Script
 ----------------------
-Scrapes product data from all retailers and saves raw data to individual Excel files.
+Scrapes product data from all retailers and saves raw data to individual Parquet files.
 
 This script:
 1. Scrapes each retailer independently
-2. Saves raw data to data/raw/{retailer}_raw.xlsx
+2. Saves raw data to data/raw/{retailer}_raw.parquet
 """
 
+import atexit
 import logging
+import logging.handlers
+import multiprocessing
+import multiprocessing.util
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-import pandas as pd
+from typing import List, Optional
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 # Import the universal scraper and configurations
 from scrapers.universal_scraper import UniversalScraper
+from scrapers.browser_pool import BrowserPool
+from scrapers.checkpoint import Checkpoint
 from scrapers.retailer_config import RETAILER_CONFIGS
 
 
-# Configure logging
-log_filename = f'logs/scraper_log_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
+# Configure logging (see setup_logging). Handlers run on a background listener
+# in the main process; worker processes only put records on its queue
 os.makedirs('logs', exist_ok=True)
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+console_handler = logging.StreamHandler(sys.stdout)
+log_queue = None
+log_listener = None
+
+
+def setup_logging(console_level: int = logging.INFO):
+    """
+    Start logging to the console and a timestamped log file.
+    
+    Called from the main process only, so worker processes that re-import this
+    module (spawn/forkserver) don't each start a listener and log file. Does
+    nothing if logging is already set up.
+    
+    Args:
+        console_level: Lowest level printed to the console; the log file
+            always gets INFO and up
+    """
+    global log_queue, log_listener
+    
+    if log_listener is not None or logging.getLogger().handlers:
+        return
+    
+    log_filename = f'logs/scraper_log_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
+    
+    log_queue = multiprocessing.Queue(-1)
+    log_listener = logging.handlers.QueueListener(
+        log_queue,
+        console_handler,
+        logging.FileHandler(log_filename),
+        respect_handler_level=True
+    )
+    for log_handler in log_listener.handlers:
+        log_handler.setFormatter(log_formatter)
+    console_handler.setLevel(console_level)
+    
+    _init_worker_logging(log_queue)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+
+def _init_worker_logging(queue):
+    """Send this process's log records to the main process's listener."""
+    if queue is None:
+        return
+    
+    queue_handler = logging.handlers.QueueHandler(queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    # Replaces any handlers a forked worker inherited from the main process
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler], force=True)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(log_filename)
-    ]
-)
 
 logger = logging.getLogger("DataCollector")
 
+RAW_DIR = Path('data/raw')
+
+# Defaults for missing raw values ('retailer' is filled per retailer)
+RAW_FILL_VALUES = {
+    'product_id': 'N/A',
+    'barcode': 'N/A',
+    'product_name': 'Unknown Product',
+    'description': 'No description available',
+    'brand': 'N/A',
+    'price': '0.00',
+    'size_weight_volume': 'N/A',
+    'unit_of_measure': 'EA',
+    'price_per_unit': '0.00',
+    'width': 'N/A',
+    'height': 'N/A',
+    'depth': 'N/A',
+    'length': 'N/A',
+    'gross_weight': 'N/A',
+    'net_weight': 'N/A',
+    'category': 'Frozen Foods',
+    'product_url': 'N/A',
+    'scrape_date': ''
+}
+
+
+_browser_pool = None
+_browser_pool_pid = None
+
+
+def _get_browser_pool() -> BrowserPool:
+    """
+    Get this process's browser pool, creating it on first use.
+    
+    Each worker process keeps one warm browser for every retailer it scrapes;
+    the browsers are closed when the process exits.
+    """
+    global _browser_pool, _browser_pool_pid
+    
+    if _browser_pool is None or _browser_pool_pid != os.getpid():
+        _browser_pool = BrowserPool()
+        _browser_pool_pid = os.getpid()
+        multiprocessing.util.Finalize(_browser_pool, _browser_pool.close_all, exitpriority=10)
+    
+    return _browser_pool
+
+
+def _scrape_one(task: tuple) -> tuple:
+    """
+    Scrape a single retailer and save its raw data to file.
+    
+    Runs in a worker process, so it builds its own scraper and logger.
+    
+    Args:
+        task: Tuple of (retailer_name, config, headless, max_pages, max_items, http_cache_ttl,
+              product_reuse_ttl)
+        
+    Returns:
+        Tuple of (retailer_name, success_boolean)
+    """
+    retailer_name, config, headless, max_pages, max_items, http_cache_ttl, product_reuse_ttl = task
+    
+    # Per-retailer log file so workers don't contend on the same handler
+    worker_logger = logging.getLogger(f"DataCollector.{retailer_name}")
+    scraper_logger = logging.getLogger(f"{retailer_name}Scraper")
+    worker_log = f'logs/{retailer_name.lower()}_scraper_log_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
+    file_handler = logging.FileHandler(worker_log)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    worker_logger.addHandler(file_handler)
+    scraper_logger.addHandler(file_handler)
+    
+    worker_logger.info("\n" + "=" * 80)
+    worker_logger.info(f"COLLECTING DATA FROM: {retailer_name}")
+    worker_logger.info("=" * 80)
+    
+    # Products are checkpointed as they are scraped, so a failed run can resume
+    # (and, with a reuse TTL, so later runs can skip recently scraped products)
+    checkpoint = Checkpoint(max_age=product_reuse_ttl) if product_reuse_ttl else Checkpoint()
+    
+    try:
+        # Create scraper instance
+        scraper = UniversalScraper(
+            retailer_name=retailer_name,
+            config=config,
+            headless=headless,
+            browser_pool=_get_browser_pool(),
+            http_cache_ttl=http_cache_ttl,
+            checkpoint=checkpoint
+        )
+        
+        # Run the scraper
+        worker_logger.info(f"Starting scrape for {retailer_name}...")
+        products = scraper.run(max_pages=max_pages, max_items=max_items)
+        
+        # No need to truncate - scraper already respects max_items
+        if not products:
+            worker_logger.warning(f"No products scraped from {retailer_name}")
+            return retailer_name, False
+        
+        # Save raw data to Parquet (intermediate format; only the comparison table is Excel)
+        filename = f"{retailer_name.lower()}_raw.parquet"
+        filepath = RAW_DIR / filename
+        
+        # Build the Arrow columns directly, filling missing values on the way
+        fill_values = {**RAW_FILL_VALUES, 'retailer': retailer_name}
+        columns = list(dict.fromkeys(key for product in products for key in product))
+        table = pa.table({
+            column: [
+                fill_values.get(column) if product.get(column) is None else product[column]
+                for product in products
+            ]
+            for column in columns
+        })
+        pq.write_table(table, filepath, compression='zstd')
+        
+        # Raw data is safely on disk; the next run should scrape fresh unless
+        # products are kept for reuse
+        if not product_reuse_ttl:
+            checkpoint.clear(retailer_name)
+        
+        worker_logger.info(f"✓ Successfully saved {len(products)} products to: {filepath}")
+        worker_logger.info(f"✓ {retailer_name} collection complete!")
+        
+        return retailer_name, True
+        
+    except Exception as e:
+        worker_logger.error(f"✗ Failed to collect data from {retailer_name}: {e}", exc_info=True)
+        return retailer_name, False
+    
+    finally:
+        checkpoint.close()
+        worker_logger.removeHandler(file_handler)
+        scraper_logger.removeHandler(file_handler)
+        file_handler.close()
+
 
 class DataCollector:
     """
     Collects raw data from all retailers and saves to individual files.
     """
     
-    def __init__(self, headless: bool = True, max_pages: int = None, max_items: int = None):
+    def __init__(self, headless: bool = True, max_pages: int = None, max_items: int = None,
+                 retailers: Optional[List[str]] = None, http_cache_ttl: Optional[int] = None,
+                 product_reuse_ttl: Optional[int] = None):
         """
         Initialize the data collector.
         
@@ -49,17 +237,24 @@ class DataCollector:
             headless: Run browsers in headless mode
             max_pages: Maximum pages to scrape per retailer (None = all)
             max_items: Maximum items to scrape per retailer (None = all)
+            retailers: Names of retailers to scrape (None = all configured retailers)
+            http_cache_ttl: Seconds to reuse cached HTTP responses (None = no cache)
+            product_reuse_ttl: Seconds to reuse a scraped product's details across runs
+                (None = scrape every product each run)
         """
         self.headless = headless
         self.max_pages = max_pages
         self.max_items = max_items
+        self.retailers = retailers
+        self.http_cache_ttl = http_cache_ttl
+        self.product_reuse_ttl = product_reuse_ttl
         
         # Ensure raw data directory exists
-        self.raw_dir = Path('data/raw')
+        self.raw_dir = RAW_DIR
         self.raw_dir.mkdir(parents=True, exist_ok=True)
         
         logger.info("Data Collector initialized")
-        logger.info(f"Configuration: headless={headless}, max_pages={max_pages}, max_items={max_items}")
+        logger.info(f"Configuration: headless={headless}, max_pages={max_pages}, max_items={max_items}, retailers={retailers or 'all'}")
     
     def collect_from_retailer(self, retailer_name: str, config: dict) -> bool:
         """
@@ -72,94 +267,59 @@ class DataCollector:
         Returns:
             True if successful, False otherwise
         """
-        logger.info("\n" + "=" * 80)
-        logger.info(f"COLLECTING DATA FROM: {retailer_name}")
-        logger.info("=" * 80)
-        
-        try:
-            # Create scraper instance
-            scraper = UniversalScraper(
-                retailer_name=retailer_name,
-                config=config,
-                headless=self.headless
-            )
-            
-            # Run the scraper
-            logger.info(f"Starting scrape for {retailer_name}...")
-            products = scraper.run(max_pages=self.max_pages, max_items=self.max_items)
-            
-            # No need to truncate - scraper already respects max_items
-            if not products:
-                logger.warning(f"No products scraped from {retailer_name}")
-                return False
-            
-            # Save raw data to Excel
-            filename = f"{retailer_name.lower()}_raw.xlsx"
-            filepath = self.raw_dir / filename
-            
-            # Convert to DataFrame
-            df = pd.DataFrame(products)
-            
-            # Fill missing values with appropriate defaults
-            fill_values = {
-                'product_id': 'N/A',
-                'barcode': 'N/A',
-                'product_name': 'Unknown Product',
-                'description': 'No description available',
-                'brand': 'N/A',
-                'price': '0.00',
-                'size_weight_volume': 'N/A',
-                'unit_of_measure': 'EA',
-                'price_per_unit': '0.00',
-                'width': 'N/A',
-                'height': 'N/A',
-                'depth': 'N/A',
-                'length': 'N/A',
-                'gross_weight': 'N/A',
-                'net_weight': 'N/A',
-                'category': 'Frozen Foods',
-                'product_url': 'N/A',
-                'retailer': retailer_name,
-                'scrape_date': ''
-            }
-            
-            # Apply fill na for each column if it exists in the DataFrame
-            for column, fill_value in fill_values.items():
-                if column in df.columns:
-                    df[column] = df[column].fillna(fill_value)
-            
-            # Save to Excel
-            df.to_excel(filepath, index=False, engine='openpyxl')
-            
-            logger.info(f"✓ Successfully saved {len(products)} products to: {filepath}")
-            logger.info(f"✓ {retailer_name} collection complete!")
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"✗ Failed to collect data from {retailer_name}: {e}", exc_info=True)
-            return False
+        _, success = _scrape_one((retailer_name, config, self.headless, self.max_pages, self.max_items,
+                                  self.http_cache_ttl, self.product_reuse_ttl))
+        return success
     
     def collect_all(self) -> dict:
         """
-        Collect data from all retailers.
+        Collect data from all retailers in parallel, one worker process per retailer.
         
         Returns:
             Dictionary with results: {retailer_name: success_boolean}
         """
+        # Workers log through the listener's queue, so it must be running first
+        setup_logging()
+        
         logger.info("\n" + "=" * 80)
         logger.info("STARTING DATA COLLECTION FROM ALL RETAILERS")
         logger.info("=" * 80)
         logger.info(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
+        tasks = [
+            (retailer_name, config, self.headless, self.max_pages, self.max_items, self.http_cache_ttl,
+             self.product_reuse_ttl)
+            for retailer_name, config in RETAILER_CONFIGS.items()
+            if self.retailers is None or retailer_name in self.retailers
+        ]
+        
         results = {}
         
-        for retailer_name, config in RETAILER_CONFIGS.items():
-            # Only shoprite and PicknPay for testing
-            # if not retailer_name in ['Checkers']:
-            #     continue
-            success = self.collect_from_retailer(retailer_name, config)
-            results[retailer_name] = success
+        if tasks:
+            # One worker per retailer: scraping mostly waits on the network,
+            # so running more workers than CPU cores still pays off
+            max_workers = len(tasks)
+            logger.info(f"Scraping {len(tasks)} retailer(s) with {max_workers} worker process(es)")
+            
+            # Separate processes: each scraper needs its own browser instance
+            # (Playwright's sync API can't be shared across threads)
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker_logging,
+                                     initargs=(log_queue,)) as executor:
+                futures = {executor.submit(_scrape_one, task): task[0] for task in tasks}
+                
+                # Report each retailer as soon as it finishes
+                finished = {}
+                for future in as_completed(futures):
+                    retailer_name = futures[future]
+                    try:
+                        _, finished[retailer_name] = future.result()
+                    except Exception as e:
+                        logger.error(f"✗ Worker for {retailer_name} crashed: {e}")
+                        finished[retailer_name] = False
+                    logger.info(f"{retailer_name} finished ({len(finished)}/{len(tasks)})")
+            
+            # Keep results in configuration order
+            results = {task[0]: finished[task[0]] for task in tasks}
         
         # Print summary
         self._print_summary(results)
@@ -198,10 +358,15 @@ class DataCollector:
 def main():
     """Main execution function."""
     
+    setup_logging()
+    
     # Configuration
-    HEADLESS = False  # Set to True for production
+    HEADLESS = True  # Set to False to watch the browser while debugging
     MAX_PAGES = None     # Number of pages to scrape per retailer
     MAX_ITEMS = 50  # Maximum items per retailer (None = no limit)
+    RETAILERS = None  # Retailers to scrape, e.g. ['Checkers'] (None = all)
+    HTTP_CACHE_TTL = None  # Seconds to reuse cached HTTP pages, e.g. 3600 while tuning selectors (None = off)
+    PRODUCT_REUSE_TTL = None  # Seconds to reuse scraped product details across runs, e.g. 12 * 3600 (None = off)
     
     logger.info("=" * 80)
     logger.info("FROZEN FOODS DATA COLLECTION")
@@ -209,7 +374,9 @@ def main():
     logger.info(f"Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     # Create collector and run
-    collector = DataCollector(headless=HEADLESS, max_pages=MAX_PAGES, max_items=MAX_ITEMS)
+    collector = DataCollector(headless=HEADLESS, max_pages=MAX_PAGES, max_items=MAX_ITEMS,
+                              retailers=RETAILERS, http_cache_ttl=HTTP_CACHE_TTL,
+                              product_reuse_ttl=PRODUCT_REUSE_TTL)
     results = collector.collect_all()
     
     logger.info(f"\nEnd Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
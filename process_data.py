@@ -4,41 +4,117 @@ Data Processing Script
 Processes raw data files from data/raw/ and creates a comparison table.
 
 This script:
-1. Loads raw Excel files from data/raw/
+1. Loads raw Parquet files from data/raw/
 2. Normalizes and cleans the data
 3. Matches similar products across retailers using fuzzy matching
 4. Creates a comparison table showing prices across retailers
 5. Saves to data/processed/price_comparison.xlsx
 """
 
+import argparse
+import atexit
+import fnmatch
+import hashlib
+import json
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 from datetime import datetime
 from pathlib import Path
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Tuple
 from rapidfuzz import fuzz, process
 
 # Import utilities
 from utils.normalizer import DataNormalizer
+from utils.excel_writer import write_rows
 
 
-# Configure logging
-log_filename = f'logs/processor_log_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
-os.makedirs('logs', exist_ok=True)
+# Configure logging (see setup_logging). Handlers run on a background listener
+# so logging calls only enqueue records
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+console_handler = logging.StreamHandler(sys.stdout)
+log_listener = None
+
+
+def setup_logging(console_level: int = logging.INFO):
+    """
+    Start logging to the console and a timestamped log file.
+    
+    Called from main() rather than on import, so importing this module (e.g.
+    from run_pipeline, whose logging is already set up) creates no log file.
+    Does nothing if logging is already set up.
+    
+    Args:
+        console_level: Lowest level printed to the console; the log file
+            always gets INFO and up
+    """
+    global log_listener
+    
+    if log_listener is not None or logging.getLogger().handlers:
+        return
+    
+    log_filename = f'logs/processor_log_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
+    os.makedirs('logs', exist_ok=True)
+    
+    log_queue = queue.Queue(-1)
+    log_listener = logging.handlers.QueueListener(
+        log_queue,
+        console_handler,
+        logging.FileHandler(log_filename),
+        respect_handler_level=True
+    )
+    for log_handler in log_listener.handlers:
+        log_handler.setFormatter(log_formatter)
+    console_handler.setLevel(console_level)
+    
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    log_listener.start()
+    atexit.register(log_listener.stop)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(log_filename)
-    ]
-)
 
 logger = logging.getLogger("DataProcessor")
 
+# Base products scored per cdist call; bounds the score matrix to
+# MATCH_BLOCK_SIZE x (other retailer's product count)
+MATCH_BLOCK_SIZE = 2048
+
+# Raw columns read by the normalizer; the only columns loaded from disk,
+# kept as object dtype in every loaded file
+RAW_OBJECT_COLUMNS = (
+    'product_name',
+    'brand',
+    'price',
+    'price_per_unit',
+    'size_weight_volume',
+    'unit_of_measure',
+    'retailer',
+    'product_url',
+)
+
+
+# Code that shapes the comparison table; editing any of it makes the next run
+# rebuild the output even if the raw files are unchanged
+PIPELINE_SOURCES = (
+    Path(__file__),
+    Path(__file__).parent / 'utils' / 'normalizer.py',
+    Path(__file__).parent / 'utils' / 'excel_writer.py',
+)
+
+
+def _pipeline_version() -> str:
+    """Hash of the PIPELINE_SOURCES files, for change detection."""
+    digest = hashlib.sha256()
+    for source in PIPELINE_SOURCES:
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
 
 class DataProcessor:
     """
@@ -59,11 +135,73 @@ class DataProcessor:
         self.processed_dir = Path('data/processed')
         self.processed_dir.mkdir(parents=True, exist_ok=True)
         
+        self.output_path = self.processed_dir / 'price_comparison.xlsx'
+        
+        # Inputs of the last successful run, used to skip unchanged reprocessing
+        self.state_path = self.processed_dir / '.pipeline_state.json'
+        
         logger.info(f"Data Processor initialized (similarity threshold: {similarity_threshold}%)")
     
+    def _find_raw_files(self) -> Dict[str, Path]:
+        """
+        Find the raw Parquet file to load for each retailer.
+        
+        Returns:
+            Dictionary of {retailer_name: newest *_raw*.parquet path},
+            ordered by modification time
+        """
+        if not self.raw_dir.exists():
+            return {}
+        
+        # Find all *_raw*.parquet files (scandir entries carry cached stat info)
+        with os.scandir(self.raw_dir) as entries:
+            raw_entries = [
+                entry for entry in entries
+                if entry.is_file() and fnmatch.fnmatch(entry.name, '*_raw*.parquet')
+            ]
+        
+        # Keep only the newest file per retailer (ordered by modification time)
+        raw_files = {}
+        for entry in sorted(raw_entries, key=lambda entry: entry.stat().st_mtime):
+            # Extract retailer name
+            retailer_name = entry.name.split('_raw')[0].title()
+            raw_files.pop(retailer_name, None)
+            raw_files[retailer_name] = Path(entry.path)
+        
+        return raw_files
+    
+    def _input_fingerprint(self) -> dict:
+        """Describe the inputs of a processing run (raw files, settings and code) for change detection."""
+        raw_files = {}
+        for retailer_name, filepath in self._find_raw_files().items():
+            stat = filepath.stat()
+            raw_files[retailer_name] = [filepath.name, stat.st_mtime_ns, stat.st_size]
+        
+        return {
+            'pipeline_version': _pipeline_version(),
+            'similarity_threshold': self.similarity_threshold,
+            'raw_files': raw_files,
+        }
+    
+    def _is_up_to_date(self, fingerprint: dict) -> bool:
+        """Check whether the last run's output was built from exactly these inputs."""
+        if not self.output_path.exists() or not self.state_path.exists():
+            return False
+        
+        try:
+            with open(self.state_path) as f:
+                return json.load(f) == fingerprint
+        except (OSError, ValueError):
+            return False
+    
+    def _save_state(self, fingerprint: dict):
+        """Record the inputs the current output was built from."""
+        with open(self.state_path, 'w') as f:
+            json.dump(fingerprint, f, indent=2)
+    
     def load_raw_files(self) -> pd.DataFrame:
         """
-        Load all raw Excel files from data/raw/ directory.
+        Load all raw Parquet files from data/raw/ directory.
         
         Returns:
             Combined DataFrame with all products from all retailers
@@ -76,8 +214,7 @@ class DataProcessor:
             logger.error(f"Raw data directory does not exist: {self.raw_dir}")
             return pd.DataFrame()
         
-        # Find all *_raw*.xlsx files
-        raw_files = list(self.raw_dir.glob('*_raw*.xlsx'))
+        raw_files = self._find_raw_files()
         
         if not raw_files:
             logger.warning(f"No raw data files found in {self.raw_dir}")
@@ -87,17 +224,17 @@ class DataProcessor:
         
         all_products = []
         
-        for filepath in raw_files:
+        for retailer_name, filepath in raw_files.items():
             try:
-                # Extract retailer name
-                retailer_name = filepath.stem.split('_raw')[0].title()
-                
                 logger.info(f"Loading: {filepath.name} ({retailer_name})")
                 
-                # Read Excel file
-                df = pd.read_excel(filepath)
+                # Read Parquet file, skipping columns the pipeline never uses
+                df = pd.read_parquet(filepath, engine='pyarrow', columns=list(RAW_OBJECT_COLUMNS))
                 df['retailer'] = retailer_name
                 
+                # Same dtypes in every frame so concat doesn't have to upcast
+                df = df.astype({col: object for col in RAW_OBJECT_COLUMNS if col in df.columns}, copy=False)
+                
                 all_products.append(df)
                 
                 logger.info(f"  ✓ Loaded {len(df)} products from {retailer_name}")
@@ -110,7 +247,7 @@ class DataProcessor:
             return pd.DataFrame()
         
         # Combine all DataFrames
-        combined_df = pd.concat(all_products, ignore_index=True)
+        combined_df = pd.concat(all_products, ignore_index=True, copy=False)
         logger.info(f"\nTotal products loaded: {len(combined_df)}")
         
         return combined_df
@@ -129,22 +266,28 @@ class DataProcessor:
         logger.info("NORMALIZING DATA")
         logger.info("=" * 80)
         
-        normalized_products = []
+        # Parse price columns in one vectorized pass
+        df = df.assign(**{
+            col: DataNormalizer.clean_prices(df[col])
+            for col in ('price', 'price_per_unit') if col in df.columns
+        })
         
-        for _, product in df.iterrows():
-            try:
-                normalized = self.normalizer.normalize_product(product.to_dict())
-                normalized_products.append(normalized)
-            except Exception as e:
-                logger.warning(f"  ⚠ Failed to normalize product: {e}")
-                continue
+        # Whole columns at a time rather than one normalize_product call per row
+        normalized_df = self.normalizer.normalize_products(df)
+        
+        # Matching key, computed once here instead of per comparison. A list
+        # comprehension over plain values skips Series.map's per-element overhead
+        if not normalized_df.empty:
+            normalize_product_name = self.normalizer.normalize_product_name
+            normalized_df['normalized_name'] = [
+                normalize_product_name(str(name)) for name in normalized_df['product_name'].tolist()
+            ]
         
-        normalized_df = pd.DataFrame(normalized_products)
         logger.info(f"  ✓ Normalized {len(normalized_df)} products")
         
         return normalized_df
     
-    def find_similar_products(self, df: pd.DataFrame) -> List[Dict]:
+    def find_similar_products(self, df: pd.DataFrame) -> Tuple[List[str], List[tuple]]:
         """
         Find similar products across retailers using fuzzy matching.
         
@@ -152,98 +295,151 @@ class DataProcessor:
             df: Normalized product DataFrame
             
         Returns:
-            List of product groups (similar products from different retailers)
+            Tuple of (column names, list of product group rows), one row per group
+            of similar products from different retailers
         """
         logger.info("\n" + "=" * 80)
         logger.info("MATCHING SIMILAR PRODUCTS")
         logger.info("=" * 80)
         
-        # Group products by retailer
-        retailers = df['retailer'].unique()
+        # Group products by retailer in a single pass (first-seen order)
+        products_by_retailer = dict(tuple(df.groupby('retailer', sort=False)))
+        retailers = list(products_by_retailer)
         logger.info(f"Retailers: {', '.join(retailers)}")
         
         # Use first retailer as base
         base_retailer = retailers[0]
-        base_products = df[df['retailer'] == base_retailer].copy()
         
-        logger.info(f"Using {base_retailer} as base ({len(base_products)} products)")
+        # Names to match, per retailer
+        normalized_by_retailer = {
+            r: products['normalized_name'].tolist()
+            for r, products in products_by_retailer.items()
+        }
         
-        matched_groups = []
-        matched_base_indices = set()
+        base_products = products_by_retailer[base_retailer]
         
-        # For each base product, find matches in other retailers
-        for idx, base_product in base_products.iterrows():
-            if idx in matched_base_indices:
+        logger.info(f"Using {base_retailer} as base ({len(base_products)} products)")
+        
+        # Score every base product against every other retailer in one batch
+        best_matches = {}
+        for other_retailer in retailers:
+            if other_retailer == base_retailer or len(products_by_retailer[other_retailer]) == 0:
                 continue
             
-            base_name = base_product['product_name']
+            best_matches[other_retailer] = self._best_matches(
+                normalized_by_retailer[base_retailer],
+                normalized_by_retailer[other_retailer]
+            )
+        
+        # Plain object arrays for positional lookups in the loop below
+        match_columns = ['price', 'price_per_unit', 'product_url', 'product_name']
+        values_by_retailer = {
+            r: products_by_retailer[r][match_columns].to_numpy(dtype=object)
+            for r in best_matches
+        }
+        
+        # Fixed output schema: shared fields, then price/unit price/url per retailer
+        columns = ['product_name', 'brand', 'size'] + [
+            f'{r}_{field}' for r in retailers for field in ('price', 'price_per_unit', 'url')
+        ]
+        # Start of each retailer's three columns in a row
+        offsets = {r: 3 + 3 * i for i, r in enumerate(retailers)}
+        base_offset = offsets[base_retailer]
+        price_slots = list(offsets.values())
+        
+        matched_groups = []
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
+        base_rows = zip(
+            base_products['product_name'].to_numpy(dtype=object),
+            base_products['brand'].to_numpy(dtype=object),
+            base_products['size_weight_volume'].to_numpy(dtype=object),
+            base_products['price'].to_numpy(dtype=object),
+            base_products['price_per_unit'].to_numpy(dtype=object),
+            base_products['product_url'].to_numpy(dtype=object),
+        )
+        
+        # For each base product, look up its best match in other retailers
+        for position, (base_name, brand, size, price, price_per_unit, url) in enumerate(base_rows):
             if not base_name:
                 continue
             
-            # Normalize name for matching
-            base_normalized = self.normalizer.normalize_product_name(base_name)
-            
             # Create product group starting with base
-            group = {
-                'product_name': base_name,
-                'brand': base_product.get('brand'),
-                'size': base_product.get('size_weight_volume'),
-            }
+            row = [None] * len(columns)
+            row[0] = base_name
+            row[1] = brand
+            row[2] = size
             
             # Add base retailer data
-            group[f'{base_retailer}_price'] = base_product.get('price')
-            group[f'{base_retailer}_price_per_unit'] = base_product.get('price_per_unit')
-            group[f'{base_retailer}_url'] = base_product.get('product_url')
+            row[base_offset:base_offset + 3] = (price, price_per_unit, url)
             
-            # Try to find matches in other retailers
-            for other_retailer in retailers:
-                if other_retailer == base_retailer:
-                    continue
-                
-                other_products = df[df['retailer'] == other_retailer]
+            for other_retailer, (best_indices, best_scores) in best_matches.items():
+                score = best_scores[position]
                 
-                if len(other_products) == 0:
-                    continue
-                
-                # Get product names for matching
-                other_names = other_products['product_name'].tolist()
-                other_normalized = [self.normalizer.normalize_product_name(str(name)) for name in other_names]
-                
-                # Find best match using fuzzy matching
-                best_match = process.extractOne(
-                    base_normalized,
-                    other_normalized,
-                    scorer=fuzz.token_sort_ratio
-                )
-                
-                if best_match and best_match[1] >= self.similarity_threshold:
-                    match_idx = best_match[2]
-                    matched_product = other_products.iloc[match_idx]
+                if score >= self.similarity_threshold:
+                    other_price, other_price_per_unit, other_url, other_name = (
+                        values_by_retailer[other_retailer][best_indices[position]]
+                    )
                     
                     # Add matched product data
-                    group[f'{other_retailer}_price'] = matched_product.get('price')
-                    group[f'{other_retailer}_price_per_unit'] = matched_product.get('price_per_unit')
-                    group[f'{other_retailer}_url'] = matched_product.get('product_url')
+                    offset = offsets[other_retailer]
+                    row[offset:offset + 3] = (other_price, other_price_per_unit, other_url)
                     
-                    logger.debug(f"Matched: {base_name} <-> {matched_product['product_name']} ({best_match[1]}%)")
+                    if debug_enabled:
+                        logger.debug(f"Matched: {base_name} <-> {other_name} ({score:.1f}%)")
             
             # Only add group if at least 2 retailers have this product
-            retailer_count = sum(1 for key in group.keys() if key.endswith('_price') and group[key] is not None)
+            retailer_count = sum(1 for slot in price_slots if row[slot] is not None)
             
             if retailer_count >= 2:
-                matched_groups.append(group)
-                matched_base_indices.add(idx)
+                matched_groups.append(tuple(row))
         
         logger.info(f"Found {len(matched_groups)} product groups with matches across retailers")
         
-        return matched_groups
+        return columns, matched_groups
     
-    def create_comparison_table(self, df: pd.DataFrame):
+    def _best_matches(self, queries: List[str], choices: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the best-scoring choice for every query.
+        
+        Scores are computed in blocks of MATCH_BLOCK_SIZE queries, so only one
+        block of the query x choice score matrix is held in memory at a time.
+        
+        Args:
+            queries: Normalized names to match
+            choices: Normalized names to match against
+            
+        Returns:
+            Tuple of (best choice index, best score) arrays, one entry per query
+        """
+        best_indices = []
+        best_scores = []
+        
+        for start in range(0, len(queries), MATCH_BLOCK_SIZE):
+            scores = process.cdist(
+                queries[start:start + MATCH_BLOCK_SIZE],
+                choices,
+                scorer=fuzz.token_sort_ratio,
+                score_cutoff=self.similarity_threshold,
+                workers=-1
+            )
+            best_indices.append(scores.argmax(axis=1))
+            best_scores.append(scores.max(axis=1))
+        
+        if not best_indices:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+        
+        return np.concatenate(best_indices), np.concatenate(best_scores)
+    
+    def create_comparison_table(self, df: pd.DataFrame) -> bool:
         """
         Create price comparison table from normalized data.
         
         Args:
             df: Normalized product DataFrame
+            
+        Returns:
+            True if the comparison table was written
         """
         logger.info("\n" + "=" * 80)
         logger.info("CREATING COMPARISON TABLE")
@@ -251,30 +447,46 @@ class DataProcessor:
         
         if df.empty:
             logger.warning("No data to process!")
-            return
+            return False
         
         # Find similar products
-        matched_groups = self.find_similar_products(df)
+        columns, matched_groups = self.find_similar_products(df)
         
         if not matched_groups:
             logger.warning("No matching products found across retailers!")
-            return
+            return False
         
         # Create comparison DataFrame
-        comparison_df = pd.DataFrame(matched_groups)
+        comparison_df = pd.DataFrame.from_records(matched_groups, columns=columns)
         
         # Sort by product name
         comparison_df = comparison_df.sort_values('product_name')
         
         # Export to Excel
-        output_path = self.processed_dir / 'price_comparison.xlsx'
-        comparison_df.to_excel(output_path, index=False, engine='openpyxl')
+        output_path = self.output_path
+        self._write_excel(comparison_df, output_path)
         
         logger.info(f"✓ Comparison table saved: {output_path}")
         logger.info(f"  Total product matches: {len(comparison_df)}")
         
         # Print statistics
         self._print_statistics(comparison_df)
+        
+        return True
+    
+    def _write_excel(self, df: pd.DataFrame, output_path: Path):
+        """
+        Write a DataFrame to Excel, streaming whole rows through xlsxwriter.
+        
+        Skips pandas' per-cell formatting layer.
+        
+        Args:
+            df: DataFrame to export
+            output_path: Destination .xlsx path
+        """
+        # Missing values become empty cells rather than NaN
+        rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+        write_rows(output_path, df.columns, rows)
     
     def _print_statistics(self, comparison_df: pd.DataFrame):
         """Print summary statistics."""
@@ -284,36 +496,52 @@ class DataProcessor:
         
         logger.info(f"\nTotal Product Matches: {len(comparison_df)}")
         
+        # Prices are already floats from the normalizer, so all retailers'
+        # statistics come from one aggregate over the price columns
+        price_stats = (
+            comparison_df.filter(regex='_price$')
+            .astype('float64')
+            .agg(['count', 'mean', 'min', 'max'])
+        )
+        retailers = [col[:-len('_price')] for col in price_stats.columns]
+        
         # Count products per retailer
-        retailers = []
-        for col in comparison_df.columns:
-            if col.endswith('_price'):
-                retailer = col.replace('_price', '')
-                retailers.append(retailer)
-                count = comparison_df[col].notna().sum()
-                logger.info(f"  • {retailer}: {count} products")
+        for retailer in retailers:
+            count = int(price_stats.at['count', f'{retailer}_price'])
+            logger.info(f"  • {retailer}: {count} products")
         
         # Price statistics per retailer
         logger.info("\nPrice Statistics by Retailer:")
         for retailer in retailers:
-            price_col = f'{retailer}_price'
-            if price_col in comparison_df.columns:
-                prices = pd.to_numeric(comparison_df[price_col], errors='coerce').dropna()
-                if len(prices) > 0:
-                    logger.info(f"  {retailer}:")
-                    logger.info(f"    • Average: R{prices.mean():.2f}")
-                    logger.info(f"    • Min: R{prices.min():.2f}")
-                    logger.info(f"    • Max: R{prices.max():.2f}")
+            stats = price_stats[f'{retailer}_price']
+            if stats['count'] > 0:
+                logger.info(f"  {retailer}:")
+                logger.info(f"    • Average: R{stats['mean']:.2f}")
+                logger.info(f"    • Min: R{stats['min']:.2f}")
+                logger.info(f"    • Max: R{stats['max']:.2f}")
         
         logger.info(f"\nProcess Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    def process_all(self):
-        """Main processing workflow."""
+    def process_all(self, force: bool = False):
+        """
+        Main processing workflow.
+        
+        Args:
+            force: Rebuild the comparison table even if the raw files,
+                   settings and code are unchanged since the last run
+        """
         logger.info("\n" + "=" * 80)
         logger.info("STARTING DATA PROCESSING")
         logger.info("=" * 80)
         logger.info(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
+        # Skip the whole run when nothing has changed since the last output
+        fingerprint = self._input_fingerprint()
+        if not force and self._is_up_to_date(fingerprint):
+            logger.info("Raw data, settings and code unchanged since last run; keeping existing output")
+            logger.info(f"Output: {self.output_path}")
+            return True
+        
         # Load raw files
         df = self.load_raw_files()
         
@@ -329,7 +557,8 @@ class DataProcessor:
             return False
         
         # Create comparison table
-        self.create_comparison_table(normalized_df)
+        if self.create_comparison_table(normalized_df):
+            self._save_state(fingerprint)
         
         logger.info("\n" + "=" * 80)
         logger.info("DATA PROCESSING COMPLETE!")
@@ -339,8 +568,15 @@ class DataProcessor:
         return True
 
 
-def main():
-    """Main execution function."""
+def main(force: bool = False):
+    """
+    Main execution function.
+    
+    Args:
+        force: Rebuild the comparison table even if nothing changed since the last run
+    """
+    
+    setup_logging()
     
     logger.info("=" * 80)
     logger.info("FROZEN FOODS DATA PROCESSING")
@@ -349,7 +585,7 @@ def main():
     
     # Create processor and run
     processor = DataProcessor()
-    success = processor.process_all()
+    success = processor.process_all(force=force)
     
     logger.info(f"\nEnd Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
@@ -358,4 +594,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Build the price comparison table from the raw data.")
+    parser.add_argument('--force', action='store_true', help="Rebuild even if nothing changed since the last run")
+    args = parser.parse_args()
+    
+    main(force=args.force)
@@ -3,42 +3,69 @@ Master Pipeline Script
 ----------------------
 Runs the complete data collection and processing pipeline.
 Simply executes collect_data.py then process_data.py.
+
+Usage:
+    python run_pipeline.py [--quiet] [--force]
 """
 
+import argparse
+import logging
 import sys
 from datetime import datetime
 import collect_data
 import process_data
 
 
-def main():
-    """Run the full pipeline: collection then processing."""
+# Banners go through the same logging setup as the collection and processing stages
+logger = logging.getLogger("Pipeline")
+
+
+def main(console_level: int = logging.INFO, force: bool = False):
+    """
+    Run the full pipeline: collection then processing.
     
-    print("\n" + "=" * 80)
-    print("FROZEN FOODS PRICE COMPARISON PIPELINE")
-    print("=" * 80)
-    print(f"Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    Args:
+        console_level: Lowest level printed to the console; the log files
+            always get INFO and up
+        force: Rebuild the comparison table even if nothing changed since the last run
+    """
+    
+    # Both stages (and the collection workers) log through this listener
+    collect_data.setup_logging(console_level)
+    
+    logger.info("\n" + "=" * 80)
+    logger.info("FROZEN FOODS PRICE COMPARISON PIPELINE")
+    logger.info("=" * 80)
+    logger.info(f"Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
     
     # Stage 1: Data Collection
-    print("STAGE 1: Data Collection")
-    print("-" * 80)
+    logger.info("STAGE 1: Data Collection")
+    logger.info("-" * 80)
     collect_data.main()
     
     # Stage 2: Data Processing
-    print("\n\nSTAGE 2: Data Processing")
-    print("-" * 80)
-    process_data.main()
+    logger.info("\n\nSTAGE 2: Data Processing")
+    logger.info("-" * 80)
+    process_data.main(force=force)
     
-    print("\n" + "=" * 80)
-    print("PIPELINE COMPLETE!")
-    print("=" * 80)
-    print(f"End Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("\nOutput: data/processed/price_comparison.xlsx\n")
+    logger.info("\n" + "=" * 80)
+    logger.info("PIPELINE COMPLETE!")
+    logger.info("=" * 80)
+    logger.info(f"End Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info("\nOutput: data/processed/price_comparison.xlsx\n")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the frozen foods price comparison pipeline.")
+    parser.add_argument('--quiet', action='store_true', help="Only print warnings and errors to the console")
+    parser.add_argument('--force', action='store_true',
+                        help="Rebuild the comparison table even if nothing changed since the last run")
+    args = parser.parse_args()
+    
     try:
-        main()
+        # Only the console is quieted: loggers stay at INFO, so the log files
+        # (including each retailer's) keep the full detail
+        main(console_level=logging.WARNING if args.quiet else logging.INFO, force=args.force)
     except Exception as e:
-        print(f"\n✗ Pipeline failed: {e}")
+        logger.error(f"\n✗ Pipeline failed: {e}")
         sys.exit(1)
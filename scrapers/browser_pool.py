@@ -0,0 +1,78 @@
+"""
+Browser Pool
+------------
+Keeps Playwright browsers running between scraper runs, so scraping several
+retailers in one process only pays the browser startup cost once.
+Each scraper still gets its own fresh browser context (cookies, storage).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict
+import logging
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser
+
+
+# Launch arguments shared by every pooled browser
+BROWSER_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+]
+
+
+class BrowserPool:
+    """
+    Lazily launches one Chromium browser per headless setting and hands it out
+    to scrapers until close_all() is called.
+    """
+    
+    def __init__(self):
+        """Initialize an empty pool; nothing is launched until acquire()."""
+        self.playwright = None
+        self._browsers: Dict[bool, Browser] = {}
+        self.logger = logging.getLogger("BrowserPool")
+    
+    def acquire(self, headless: bool = True) -> Browser:
+        """
+        Get a running browser, launching it on first use.
+        
+        Args:
+            headless: Run browser in headless mode
+        
+        Returns:
+            A connected Playwright Browser
+        """
+        browser = self._browsers.get(headless)
+        if browser is not None and browser.is_connected():
+            return browser
+        
+        if self.playwright is None:
+            # Imported on first launch so HTTP-only runs never load Playwright
+            from playwright.sync_api import sync_playwright
+            self.playwright = sync_playwright().start()
+        
+        self.logger.info(f"Launching browser (headless={headless})...")
+        browser = self.playwright.chromium.launch(headless=headless, args=BROWSER_ARGS)
+        self._browsers[headless] = browser
+        
+        return browser
+    
+    def close_all(self):
+        """Close every pooled browser and stop Playwright."""
+        for browser in self._browsers.values():
+            try:
+                browser.close()
+            except Exception as e:
+                self.logger.error(f"Error closing browser: {e}")
+        self._browsers.clear()
+        
+        if self.playwright:
+            try:
+                self.playwright.stop()
+            except Exception as e:
+                self.logger.error(f"Error stopping Playwright: {e}")
+            self.playwright = None
@@ -0,0 +1,102 @@
+"""
+Scrape Checkpoint
+-----------------
+Records every scraped product in a small SQLite database as soon as it is
+parsed, so a collection run that dies part-way can pick up where it left off
+instead of re-fetching every product page.
+
+Normally a retailer's checkpoint is cleared once its raw data is saved. With a
+reuse TTL it is kept instead, so incremental runs within the TTL reuse product
+details rather than visiting every product page again.
+"""
+
+from typing import Dict
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+
+CHECKPOINT_PATH = 'data/.checkpoint.db'
+
+# Older checkpointed products are scraped again rather than reused
+CHECKPOINT_MAX_AGE = 24 * 60 * 60
+
+
+class Checkpoint:
+    """
+    Per-product store of scraped data, keyed by retailer and product URL.
+    
+    Safe to use from several threads; separate processes share the file
+    through SQLite's WAL journal.
+    """
+    
+    def __init__(self, path: str = CHECKPOINT_PATH, max_age: int = CHECKPOINT_MAX_AGE):
+        """
+        Open (or create) the checkpoint database.
+        
+        Args:
+            path: SQLite database file
+            max_age: Seconds a checkpointed product stays reusable
+        """
+        self.logger = logging.getLogger("Checkpoint")
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS scraped ('
+            'retailer TEXT, product_url TEXT, payload TEXT, saved_at REAL, '
+            'PRIMARY KEY (retailer, product_url))'
+        )
+    
+    def load(self, retailer_name: str) -> Dict[str, Dict]:
+        """
+        Get the products checkpointed for a retailer.
+        
+        Expired products are deleted rather than just skipped, so a kept
+        checkpoint does not grow from run to run.
+        
+        Args:
+            retailer_name: Name of the retailer
+        
+        Returns:
+            Dictionary of {product_url: product data}
+        """
+        cutoff = time.time() - self.max_age
+        
+        with self._lock:
+            self.conn.execute(
+                'DELETE FROM scraped WHERE retailer = ? AND saved_at < ?',
+                (retailer_name, cutoff)
+            )
+            rows = self.conn.execute(
+                'SELECT product_url, payload FROM scraped WHERE retailer = ?',
+                (retailer_name,)
+            ).fetchall()
+        
+        if rows:
+            self.logger.info(f"Resuming {retailer_name}: {len(rows)} products already scraped")
+        
+        return {product_url: json.loads(payload) for product_url, payload in rows}
+    
+    def save(self, retailer_name: str, product: Dict):
+        """Record one scraped product."""
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO scraped VALUES (?, ?, ?, ?)',
+                (retailer_name, product['product_url'], json.dumps(product), time.time())
+            )
+    
+    def clear(self, retailer_name: str):
+        """Forget a retailer's products once its raw data has been saved."""
+        with self._lock:
+            self.conn.execute('DELETE FROM scraped WHERE retailer = ?', (retailer_name,))
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
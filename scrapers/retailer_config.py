@@ -3,11 +3,31 @@ Retailer Configuration
 ----------------------
 Configuration for each retailer's scraping selectors and URLs.
 This is the ONLY place you need to update when retailers change their site structure.
+
+'scrape_mode' selects how pages are loaded:
+    'browser' - render pages with Playwright (needed for JavaScript-heavy sites)
+    'http'    - fetch server-rendered HTML directly, much faster when it works
+    'hybrid'  - render listing pages in the browser, fetch product pages directly
+
+'http_workers' (optional, default 8) caps how many product pages are fetched
+at once in 'http' and 'hybrid' modes.
+
+'browser_tabs' (optional, default 4) is how many product pages load at once
+in 'browser' mode, each in its own tab.
+
+'block_stylesheets' (optional, default False) also skips CSS in 'browser' mode.
+Only set it where the listing and product pages still work unstyled: popups,
+dropdowns and next_button clicks depend on layout.
+
+'page_url_template' (optional, 'http' mode) is the listing URL with a {page}
+placeholder, e.g. '...?page={page}'. When set, listing pages are fetched
+concurrently instead of following next_button one page at a time.
 """
 
 RETAILER_CONFIGS = {
     'Shoprite': {
         'category_url': 'https://www.shoprite.co.za/c-2540/All-Departments/Food/Frozen-Food',
+        'scrape_mode': 'browser',
         'selectors': {
             'product_card': 'div.item-product',
             'product_link': 'a.product-listening-click',
@@ -21,6 +41,7 @@ RETAILER_CONFIGS = {
     
     'Checkers': {
         'category_url': 'https://www.checkers.co.za/department/frozen-foods-1-67075db0ff9878113640072b',
+        'scrape_mode': 'browser',
         'selectors': {
             'product_card': 'div.product-card_card__DsB3_.product-card_card-merch__gWn4Y',
             'product_link': 'div.product-card_card__DsB3_.product-card_card-merch__gWn4Y a',
@@ -35,6 +56,7 @@ RETAILER_CONFIGS = {
     
     'PicknPay': {
         'category_url': 'https://www.pnp.co.za/c/frozen-food-423144840',
+        'scrape_mode': 'browser',
         'selectors': {
             'product_card': 'ui-product-grid-item.ng-star-inserted',
             'product_link': 'a.product-grid-item__info-container__name.product-action',
@@ -5,23 +5,126 @@ A single, configuration-driven scraper that works for all retailers.
 No need for separate scraper files - just update retailer_config.py!
 """
 
-from playwright.sync_api import sync_playwright, Page, Browser
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
-from urllib.parse import urljoin
+from __future__ import annotations
+
+from selectolax.lexbor import LexborHTMLParser
+from typing import TYPE_CHECKING, List, Dict, Optional, Iterator, Tuple, Callable
+from urllib.parse import urljoin, urlsplit
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
 import time
 import logging
 import random
 import re
 from datetime import datetime
 
+from scrapers.browser_pool import BrowserPool
+from scrapers.checkpoint import Checkpoint
+
+# Playwright is only loaded when a browser is actually launched (see BrowserPool),
+# so 'http' mode runs never import it
+if TYPE_CHECKING:
+    from playwright.sync_api import Page, Browser, BrowserContext
+
+
+# Resource types never needed for scraping; aborted before they are downloaded.
+# Stylesheets are kept (unless a retailer sets block_stylesheets) because
+# visibility checks and clicks depend on layout.
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+
+# Analytics and tracking hosts (and their subdomains); nothing scraped comes from them
+BLOCKED_HOSTS = frozenset({
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'facebook.net',
+    'segment.com',
+    'segment.io',
+    'hotjar.com',
+    'clarity.ms',
+    'newrelic.com',
+    'nr-data.net',
+})
+
+# Rendered <body> without scripts, styles and inline SVGs. Nothing is read from
+# them, and they are most of a retailer page's HTML, so dropping them in the
+# browser shrinks what is sent back to Python and parsed
+PAGE_BODY_JS = """() => {
+    const body = document.body.cloneNode(true);
+    body.querySelectorAll('script, style, noscript, template, svg, iframe').forEach(node => node.remove());
+    return body.outerHTML;
+}"""
+
+# Shared by every scraper logger that has no handler of its own
+LOG_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# SQLite file of cached HTTP responses (used when http_cache_ttl is set)
+HTTP_CACHE_PATH = 'data/.http_cache'
+
+# Patterns used on every product page, compiled once
+_PRICE_RE = re.compile(r'(\d+[.,]\d{2})', re.ASCII)
+_WEIGHT_RE = re.compile(r'([\d.]+)\s*(kg|g|l|ml)', re.IGNORECASE)
+_MULTI_PACK_IN_NAME_RE = re.compile(r'(\d+)\s*x\s*(\d+(?:\.\d+)?)\s*(kg|g|l|ml)\b', re.IGNORECASE)
+_SIZE_IN_NAME_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(kg|g|l|ml)\b', re.IGNORECASE)
+_CHECKERS_PRODUCT_ID_RE = re.compile(r'-(\d{8})(?:EA|KG|L)?$')
+
+# Whether the next_button element exists and is enabled, read in one round-trip
+NEXT_PAGE_ENABLED_JS = """(selector) => {
+    const button = document.querySelector(selector);
+    return !!button && !(button.hasAttribute('disabled') || button.getAttribute('aria-disabled') === 'true');
+}"""
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+@lru_cache(maxsize=4096)
+def absolute_url(base_url: str, href: str) -> str:
+    """
+    Resolve a link against the page it was found on.
+    
+    Cards often link to the same product more than once, so results are cached,
+    and hrefs that are already absolute skip urljoin's parsing entirely.
+    """
+    if href.startswith(('https://', 'http://')):
+        return href
+    return urljoin(base_url, href)
+
+
+def product_id_from_path(url: str) -> Optional[str]:
+    """
+    Get the digits (6 or more) that begin the first such URL path segment.
+    
+    Same result as searching for r'/(\d{6,})', with plain string operations.
+    """
+    for segment in url.split('/')[1:]:
+        digits = len(segment) - len(segment.lstrip('0123456789'))
+        if digits >= 6:
+            return segment[:digits]
+    return None
+
+
+def checkers_product_id(url: str) -> Optional[str]:
+    """Get the product ID from a Checkers URL (format: .../product-name-10375535EA)."""
+    id_match = _CHECKERS_PRODUCT_ID_RE.search(url)
+    return id_match.group(1) if id_match else None
+
 
 class UniversalScraper:
     """
     A flexible scraper that adapts to different retailers using configuration.
     """
     
-    def __init__(self, retailer_name: str, config: Dict, headless: bool = True):
+    def __init__(self, retailer_name: str, config: Dict, headless: bool = True,
+                 browser_pool: Optional[BrowserPool] = None, http_cache_ttl: Optional[int] = None,
+                 checkpoint: Optional[Checkpoint] = None):
         """
         Initialize the universal scraper.
         
@@ -29,20 +132,64 @@ class UniversalScraper:
             retailer_name: Name of the retailer (e.g., "Shoprite")
             config: Configuration dictionary from retailer_config.py
             headless: Run browser in headless mode
+            browser_pool: Shared pool to take a running browser from
+                          (None = launch and close a private browser)
+            http_cache_ttl: Seconds to reuse cached HTTP responses
+                            (None = always fetch fresh pages)
+            checkpoint: Store that records each scraped product and supplies
+                        products saved by an interrupted run (None = no resume)
         """
         self.retailer_name = retailer_name
         self.config = config
         self.headless = headless
+        self.browser_pool = browser_pool or BrowserPool()
+        self._owns_browser_pool = browser_pool is None
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
-        self.playwright = None
+        self.tabs: List[Page] = []
+        self.session: Optional[requests.Session] = None
+        
+        # 'browser' renders pages with Playwright; 'http' fetches HTML directly;
+        # 'hybrid' renders listing pages but fetches product pages directly
+        self.scrape_mode = config.get('scrape_mode', 'browser')
+        
+        # Product pages fetched at once over HTTP, and loaded at once in browser tabs
+        self.http_workers = config.get('http_workers', 8)
+        self.browser_tabs = config.get('browser_tabs', 4)
+        
+        # Resource types this retailer's pages load without
+        self.blocked_resource_types = BLOCKED_RESOURCE_TYPES
+        if config.get('block_stylesheets'):
+            self.blocked_resource_types = self.blocked_resource_types | {'stylesheet'}
+        
+        self.http_cache_ttl = http_cache_ttl
+        
+        # Product URLs already queued this run; the same product can be listed
+        # on several pages or subsections
+        self.seen_product_urls = set()
+        
+        # Products saved by an earlier, interrupted run (loaded in run())
+        self.checkpoint = checkpoint
+        self.checkpointed_products: Dict[str, Dict] = {}
         
         # Setup logging
         self.logger = self._setup_logger()
         
+        # Retailer-specific parsing, chosen once rather than per product
+        self.selectors = config['selectors']
+        self.parse_retailer_details = {
+            'Shoprite': self._parse_shoprite_details,
+            'Checkers': self._parse_checkers_details,
+            'PicknPay': self._parse_picknpay_details,
+        }.get(retailer_name, self._parse_default_details)
+        
+        # Checkers IDs end the URL; other retailers have them as a path segment
+        self.product_id_from_url = checkers_product_id if retailer_name == 'Checkers' else product_id_from_path
+        
         # Scraping settings
-        self.min_delay = 1.5
-        self.max_delay = 1.0
+        self.min_delay = 1.0
+        self.max_delay = 1.5
         self.timeout = 30000
         
     def _setup_logger(self) -> logging.Logger:
@@ -52,11 +199,7 @@ class UniversalScraper:
         
         if not logger.handlers:
             handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                f'%(asctime)s - {self.retailer_name} - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            handler.setFormatter(formatter)
+            handler.setFormatter(LOG_FORMATTER)
             logger.addHandler(handler)
             
         return logger
@@ -65,47 +208,112 @@ class UniversalScraper:
         """Initialize Playwright browser."""
         try:
             self.logger.info("Starting browser...")
-            self.playwright = sync_playwright().start()
+            self.browser = self.browser_pool.acquire(self.headless)
             
-            self.browser = self.playwright.chromium.launch(
-                headless=self.headless,
-                args=['--disable-blink-features=AutomationControlled']
-            )
-            
-            context = self.browser.new_context(
+            # A fresh context per run keeps cookies/storage isolated between retailers
+            self.context = self.browser.new_context(
                 viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+                user_agent=USER_AGENT
             )
+            self.context.route('**/*', self._block_heavy_resources)
             
-            self.page = context.new_page()
+            self.page = self.context.new_page()
             self.page.set_default_timeout(self.timeout)
             
+            # Product pages load in their own tabs, so the listing page stays put.
+            # Hybrid mode fetches product pages over HTTP, so one tab is plenty
+            tab_count = 1 if self.scrape_mode == 'hybrid' else self.browser_tabs
+            self.tabs = [self.context.new_page() for _ in range(tab_count)]
+            for tab in self.tabs:
+                tab.set_default_timeout(self.timeout)
+            
             self.logger.info("Browser started successfully")
             
         except Exception as e:
             self.logger.error(f"Failed to start browser: {e}")
             raise
     
+    def _block_heavy_resources(self, route):
+        """Abort requests for images, media, fonts and trackers; let everything else through."""
+        if route.request.resource_type in self.blocked_resource_types or self._is_blocked_host(route.request.url):
+            route.abort()
+        else:
+            route.continue_()
+    
+    @staticmethod
+    def _is_blocked_host(url: str) -> bool:
+        """Check whether a URL points at a blocked host or one of its subdomains."""
+        labels = (urlsplit(url).hostname or '').split('.')
+        return any('.'.join(labels[i:]) in BLOCKED_HOSTS for i in range(len(labels) - 1))
+    
     def close_browser(self):
-        """Close browser and clean up."""
+        """Close this scraper's context; the browser itself is closed only if not pooled."""
         try:
+            for tab in self.tabs:
+                tab.close()
+            self.tabs = []
             if self.page:
                 self.page.close()
-            if self.browser:
-                self.browser.close()
-            if self.playwright:
-                self.playwright.stop()
+            if self.context:
+                self.context.close()
+            if self._owns_browser_pool:
+                self.browser_pool.close_all()
             self.logger.info("Browser closed successfully")
         except Exception as e:
             self.logger.error(f"Error closing browser: {e}")
     
+    def start_session(self):
+        """Initialize a plain HTTP session (used when scrape_mode is 'http')."""
+        self.logger.info("Starting HTTP session...")
+        if self.http_cache_ttl:
+            # Re-runs within the TTL (e.g. while tuning selectors) read pages from disk
+            self.session = requests_cache.CachedSession(
+                HTTP_CACHE_PATH, backend='sqlite', expire_after=self.http_cache_ttl
+            )
+        else:
+            self.session = requests.Session()
+        
+        # One pooled connection per concurrent product fetch
+        adapter = HTTPAdapter(pool_maxsize=self.http_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept': 'text/html,application/xhtml+xml',
+            'Accept-Encoding': 'gzip, deflate',
+        })
+    
+    def close_session(self):
+        """Close the HTTP session."""
+        if self.session:
+            self.session.close()
+            self.session = None
+            self.logger.info("HTTP session closed")
+    
+    def fetch_html(self, url: str) -> Optional[str]:
+        """Fetch a page's HTML over plain HTTP, without a browser."""
+        try:
+            self.logger.info(f"Fetching: {url}")
+            response = self.session.get(url, timeout=self.timeout / 1000)
+            response.raise_for_status()
+            
+            # No need to be polite to the local cache
+            if not getattr(response, 'from_cache', False):
+                self.wait_random()
+            return response.text
+        except requests.RequestException as e:
+            self.logger.error(f"Failed to fetch {url}: {e}")
+            return None
+    
     def wait_random(self):
         """Wait random time to mimic human behavior."""
         delay = random.uniform(self.min_delay, self.max_delay)
         time.sleep(delay)
     
-    def close_popups(self):
+    def close_popups(self, page: Optional[Page] = None):
         """Close any popups that might appear (e.g., PicknPay location popup)."""
+        page = page or self.page
         try:
             if self.retailer_name == 'PicknPay':
                 # Check for location popup "Do it later" button
@@ -113,32 +321,48 @@ class UniversalScraper:
                 
                 # Wait briefly to see if popup appears
                 try:
-                    self.page.wait_for_selector(popup_button_selector, timeout=1000)
+                    page.wait_for_selector(popup_button_selector, timeout=1000)
                     # If found, click it
-                    self.page.click(popup_button_selector)
+                    page.click(popup_button_selector)
                     self.logger.info("Closed PicknPay location popup")
-                    self.page.wait_for_timeout(1000)  # Wait for popup to close
+                    page.wait_for_timeout(1000)  # Wait for popup to close
                 except Exception as e:
                     # Popup might not appear every time, that's fine
                     self.logger.debug(f"No popup found or already closed: {e}")
         except Exception as e:
             self.logger.warning(f"Error handling popups: {e}")
     
-    def safe_navigate(self, url: str) -> bool:
-        """Safely navigate to a URL."""
+    def wait_until_ready(self, page: Page, ready_selector: Optional[str]):
+        """
+        Wait for the element that shows a page's content has rendered.
+        
+        Args:
+            page: Page to wait on
+            ready_selector: CSS selector of a required element (None = DOM loaded is enough)
+        """
+        if not ready_selector:
+            return
+        
+        try:
+            page.wait_for_selector(ready_selector, timeout=10000)
+        except Exception as e:
+            # Empty listings and removed products never render it; parse what's there
+            self.logger.warning(f"Timed out waiting for {ready_selector}: {e}")
+    
+    def safe_navigate(self, url: str, ready_selector: Optional[str] = None) -> bool:
+        """
+        Safely navigate to a URL.
+        
+        Args:
+            url: URL to open
+            ready_selector: CSS selector to wait for before the page counts as loaded
+        """
         try:
             self.logger.info(f"Navigating to: {url}")
             
-            # Try to navigate with networkidle wait (better for JavaScript-heavy sites)
-            try:
-                self.page.goto(url, wait_until='networkidle', timeout=30000)
-            except Exception as e:
-                # Fallback to domcontentloaded if networkidle times out
-                self.logger.warning(f"Network idle timeout, falling back to domcontentloaded: {e}")
-                self.page.goto(url, wait_until='domcontentloaded', timeout=15000)
-            
-            # Additional wait to ensure page is stable
-            self.page.wait_for_timeout(2000)  # Wait 2 seconds
+            # Wait for the content itself; analytics keep networkidle from ever settling
+            self.page.goto(url, wait_until='domcontentloaded', timeout=15000)
+            self.wait_until_ready(self.page, ready_selector)
             
             # Handle any popups that might appear
             self.close_popups()
@@ -150,19 +374,42 @@ class UniversalScraper:
             self.logger.error(f"Failed to navigate to {url}: {e}")
             return False
     
+    def start_navigation(self, page: Page, url: str) -> bool:
+        """
+        Begin loading a URL in a tab without waiting for the page to finish.
+        
+        Pair with finish_navigation(); starting several tabs first lets them
+        load in parallel.
+        """
+        try:
+            self.logger.info(f"Navigating to: {url}")
+            page.goto(url, wait_until='commit', timeout=30000)
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to navigate to {url}: {e}")
+            return False
+    
+    def finish_navigation(self, page: Page, ready_selector: Optional[str] = None):
+        """Wait for a tab started with start_navigation() to load, as safe_navigate() does."""
+        page.wait_for_load_state('domcontentloaded', timeout=15000)
+        self.wait_until_ready(page, ready_selector)
+        
+        # Handle any popups that might appear
+        self.close_popups(page)
+    
+    def page_html(self, page: Optional[Page] = None) -> str:
+        """Get a rendered page's body HTML, stripped of scripts and styles in the browser."""
+        page = page or self.page
+        try:
+            return page.evaluate(PAGE_BODY_JS)
+        except Exception as e:
+            self.logger.warning(f"Could not read page body, using full content: {e}")
+            return page.content()
+    
     def has_next_page(self) -> bool:
         """Check if next page exists."""
         try:
-            selector = self.config['selectors']['next_button']
-            next_button = self.page.query_selector(selector)
-            
-            if not next_button:
-                return False
-            
-            is_disabled = next_button.get_attribute('disabled')
-            aria_disabled = next_button.get_attribute('aria-disabled')
-            
-            return not (is_disabled or aria_disabled == 'true')
+            return self.page.evaluate(NEXT_PAGE_ENABLED_JS, self.selectors['next_button'])
             
         except Exception as e:
             self.logger.warning(f"Error checking for next page: {e}")
@@ -171,16 +418,11 @@ class UniversalScraper:
     def go_to_next_page(self) -> bool:
         """Navigate to next page."""
         try:
-            selector = self.config['selectors']['next_button']
-            next_button = self.page.query_selector(selector)
-            
-            if next_button:
-                next_button.click()
-                self.page.wait_for_load_state('domcontentloaded')
-                self.wait_random()
-                return True
-            
-            return False
+            # Called after has_next_page(), so the button is there; click it in one call
+            self.page.click(self.selectors['next_button'], timeout=5000)
+            self.page.wait_for_load_state('domcontentloaded')
+            self.wait_random()
+            return True
             
         except Exception as e:
             self.logger.error(f"Error navigating to next page: {e}")
@@ -194,34 +436,30 @@ class UniversalScraper:
             # Find all section headers with "View All" links
             self.logger.info("Looking for Checkers subsections...")
             
+            # Parse the rendered page once instead of querying the browser per element
+            page_url = self.page.url
+            tree = LexborHTMLParser(self.page_html())
+            
             # Get all h2 section headers
-            section_headers = self.page.query_selector_all('h2.section-header_heading__9mOCx')
+            section_headers = tree.css('h2.section-header_heading__9mOCx')
             self.logger.info(f"Found {len(section_headers)} section headers")
             
-            # For each section, find the "View All" link
+            # One "View All" link per section, in page order
             subsection_urls = []
-            for header in section_headers:
-                try:
-                    # Get the parent container and look for a link with "View All" text
-                    parent = header.evaluate('el => el.closest("section") || el.parentElement')
-                    # Look for anchor tags near the header
-                    links = self.page.query_selector_all('a[href*="/department/frozen-foods/"]')
-                    
-                    for link in links:
-                        href = link.get_attribute('href')
-                        link_text = link.text_content() or ''
-                        
-                        # Check if this is a "View All" link
-                        if 'view all' in link_text.lower() and href and href not in subsection_urls:
-                            # Convert relative URL to absolute if needed
-                            if not href.startswith('http'):
-                                href = urljoin(self.page.url, href)
-                            subsection_urls.append(href)
-                            self.logger.info(f"Found subsection: {link_text.strip()} -> {href}")
-                            break
-                except Exception as e:
-                    self.logger.debug(f"Error processing section header: {e}")
-                    continue
+            for link in tree.css('a[href*="/department/frozen-foods/"]'):
+                if len(subsection_urls) >= len(section_headers):
+                    break
+                
+                href = link.attributes.get('href')
+                link_text = link.text()
+                
+                # Check if this is a "View All" link
+                if 'view all' in link_text.lower() and href:
+                    # Convert relative URL to absolute if needed
+                    href = absolute_url(page_url, href)
+                    if href not in subsection_urls:
+                        subsection_urls.append(href)
+                        self.logger.info(f"Found subsection: {link_text.strip()} -> {href}")
             
             self.logger.info(f"Found {len(subsection_urls)} subsections to scrape")
             
@@ -234,7 +472,7 @@ class UniversalScraper:
             for subsection_url in subsection_urls:
                 self.logger.info(f"Processing subsection: {subsection_url}")
                 
-                if not self.safe_navigate(subsection_url):
+                if not self.safe_navigate(subsection_url, self.selectors['product_card']):
                     self.logger.warning(f"Failed to navigate to subsection: {subsection_url}")
                     continue
                 
@@ -255,7 +493,6 @@ class UniversalScraper:
                         break
                     
                     current_page += 1
-                    self.wait_random()
             
             self.logger.info(f"Total pages collected from all subsections: {len(all_page_urls)}")
             
@@ -291,7 +528,6 @@ class UniversalScraper:
                 break
             
             current_page += 1
-            self.wait_random()
         
         self.logger.info(f"Total pages collected: {len(page_urls)}")
         return page_urls
@@ -301,47 +537,56 @@ class UniversalScraper:
         product_urls = []
         
         try:
-            card_selector = self.config['selectors']['product_card']
-            link_selector = self.config['selectors']['product_link']
+            card_selector = self.selectors['product_card']
+            link_selector = self.selectors['product_link']
             
             self.page.wait_for_selector(card_selector, timeout=10000)
             
-            product_elements = self.page.query_selector_all(link_selector)
+            # Parse the rendered listing once instead of one browser round-trip per link
+            current_url = self.page.url
+            tree = LexborHTMLParser(self.page_html())
             
-            for element in product_elements:
-                href = element.get_attribute('href')
+            for element in tree.css(link_selector):
+                href = element.attributes.get('href')
                 if href:
                     # If relative URL, convert to absolute
-                    if not href.startswith('http'):
-                        current_url = self.page.url
-                        href = urljoin(current_url, href)
-                    product_urls.append(href)
+                    product_urls.append(absolute_url(current_url, href))
             
         except Exception as e:
             self.logger.error(f"Error extracting product URLs: {e}")
         
-        return list(set(product_urls))
+        # Drop repeats (cards often link twice) but keep page order for resumable runs
+        return list(dict.fromkeys(product_urls))
+    
+    def filter_new_product_urls(self, product_urls: List[str]) -> List[str]:
+        """
+        Drop URLs already queued this run (and repeats within the list), keeping order.
+        
+        URLs are only marked as seen once queued for scraping, so any left over
+        when max_items is reached are not lost.
+        """
+        return [url for url in dict.fromkeys(product_urls) if url not in self.seen_product_urls]
     
-    def extract_text(self, soup: BeautifulSoup, selectors) -> Optional[str]:
+    def extract_text(self, tree: LexborHTMLParser, selectors) -> Optional[str]:
         """Try multiple selectors to extract text. Accepts string or list of strings."""
         # Handle both string and list of strings
         if isinstance(selectors, str):
             selectors = [selectors]
         
         for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element.get_text(strip=True)
+            element = tree.css_first(selector)
+            if element is not None:
+                return element.text(strip=True)
         return None
     
-    def extract_price(self, soup: BeautifulSoup) -> Optional[str]:
+    def extract_price(self, tree: LexborHTMLParser) -> Optional[str]:
         """Extract price with cleaning."""
-        selectors = self.config['selectors']['price']
-        price_text = self.extract_text(soup, selectors)
+        selectors = self.selectors['price']
+        price_text = self.extract_text(tree, selectors)
         
         if price_text:
             self.logger.debug(f"Found price text: {price_text}")
-            price_match = re.search(r'R?\s*(\d+[.,]\d{2})', price_text)
+            price_match = _PRICE_RE.search(price_text)
             if price_match:
                 price = price_match.group(1).replace(',', '.')
                 self.logger.debug(f"Extracted price: {price}")
@@ -375,32 +620,45 @@ class UniversalScraper:
             'scrape_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
     
-    def extract_product_details(self, product_url: str) -> Optional[Dict]:
-        """Extract product details from product page."""
-        product = self.create_product_template()
-        product['product_url'] = product_url
+    def extract_product_details(self, product_url: str, page: Page) -> Optional[Dict]:
+        """
+        Extract a product's details from a browser tab.
         
+        Args:
+            product_url: Product page URL
+            page: Tab whose navigation to product_url was begun with start_navigation()
+        """
         try:
-            # Navigate to product page first
-            if not self.safe_navigate(product_url):
-                return None
+            # Wait for the product page to finish loading
+            self.finish_navigation(page, self.selectors['product_name'])
             
             # For Shoprite: Click dropdown button to reveal product information table
             if self.retailer_name == 'Shoprite':
                 try:
                     prodInfo_selector_button = 'li#accessibletabsnavigation0-1'
                     # Wait for the dropdown button to be available
-                    self.page.wait_for_selector(prodInfo_selector_button, timeout=5000)
+                    page.wait_for_selector(prodInfo_selector_button, timeout=5000)
                     # Click it to expand the product information section
-                    self.page.click(prodInfo_selector_button)
+                    page.click(prodInfo_selector_button)
                     # Wait a moment for the table to expand
-                    self.page.wait_for_timeout(1000)
+                    page.wait_for_timeout(1000)
                     self.logger.info("Clicked product information dropdown")
                 except Exception as e:
                     self.logger.warning(f"Could not click dropdown button: {e}")
             
-            content = self.page.content()
-            
+            content = self.page_html(page)
+        except Exception as e:
+            self.logger.error(f"Error extracting details for {product_url}: {e}")
+            return None
+        
+        return self.parse_product_page(content, product_url)
+    
+    def parse_product_page(self, content: str, product_url: str) -> Optional[Dict]:
+        """Extract product details from a product page's HTML."""
+        product = self.create_product_template()
+        product['product_url'] = product_url
+        
+        try:
             # Debug: Log first 200 characters of content to see what we're getting
             content_preview = content[:200] if content else "EMPTY"
             self.logger.debug(f"Page content preview: {content_preview}")
@@ -410,131 +668,286 @@ class UniversalScraper:
                 self.logger.error(f"Invalid HTML content received. First 500 chars: {content[:500]}")
                 return None
             
-            soup = BeautifulSoup(content, 'lxml')
+            tree = LexborHTMLParser(content)
             
             # Extract using configured selectors
             product['product_name'] = self.extract_text(
-                soup, self.config['selectors']['product_name']
+                tree, self.selectors['product_name']
             )
 
             # Only extract description if selector exists (not all retailers have it)
-            if 'description' in self.config['selectors']:
+            if 'description' in self.selectors:
                 product['description'] = self.extract_text(
-                    soup, self.config['selectors']['description']
+                    tree, self.selectors['description']
                 )
             
-            # The product information for Shoprite is in a table
-            if self.retailer_name == 'Shoprite':
-                table_data = {}
-                try:
-                    table_selector = 'table.pdp__product-information'
-                    # Find the table
-                    table = soup.select_one(table_selector)
-                    if not table:
-                        self.logger.warning(f"Table not found with selector: {table_selector}")
-                        return table_data
-                    
-                    # Extract all rows
-                    rows = table.find_all('tr')
-                    
-                    for row in rows:
-                        cells = row.find_all(['td', 'th'])
-                        
-                        # Each row should have 2 cells: label and value
-                        if len(cells) >= 2:
-                            label = cells[0].get_text(strip=True)
-                            value = cells[1].get_text(strip=True)
+            # Retailer-specific fields (parser chosen once in __init__)
+            self.parse_retailer_details(tree, product)
+            
+            product['price'] = self.extract_price(tree)
+            
+            # Extract product ID from URL (retailer-specific pattern)
+            product_id = self.product_id_from_url(product_url)
+            if product_id:
+                product['product_id'] = product_id
+
+            # Calculate the price per unit (price per kg or price per liter)
+            if product['price']:
+                # If unit of measure is EA (Each), price per unit is just the price
+                if product['unit_of_measure'] == 'EA':
+                    product['price_per_unit'] = product['price']
+                # Otherwise calculate based on size/weight/volume
+                elif product['size_weight_volume']:
+                    try:
+                        # Parse the size/weight/volume to get number and unit
+                        size_match = _WEIGHT_RE.search(product['size_weight_volume'])
+                        if size_match:
+                            amount = float(size_match.group(1))
+                            unit = size_match.group(2).lower()
+                            price = float(product['price'])
                             
-                            # Store with cleaned label as key
-                            table_data[label] = value
-                    
-                    self.logger.info(f"Extracted {len(table_data)} fields from table")
+                            # Normalize to kg or L
+                            if unit == 'g':
+                                normalized_amount = amount / 1000  # Convert g to kg
+                            elif unit == 'ml':
+                                normalized_amount = amount / 1000  # Convert ml to L
+                            else:
+                                normalized_amount = amount  # Already kg or L
+                            
+                            # Calculate price per kg or per L
+                            if normalized_amount > 0:
+                                price_per_unit = price / normalized_amount
+                                product['price_per_unit'] = f"{price_per_unit:.2f}"
+                                self.logger.debug(f"Calculated price_per_unit: R{price_per_unit:.2f} per {'kg' if unit in ['kg', 'g'] else 'L'}")
                     
-                except Exception as e:
-                    self.logger.error(f"Error extracting table data: {e}")
+                    except (ValueError, ZeroDivisionError) as e:
+                        self.logger.warning(f"Could not calculate price_per_unit: {e}")
+            self.logger.info('Product extraction complete')
+        except Exception as e:
+            self.logger.error(f"Error extracting details for {product_url}: {e}")
+            return None
+        
+        return product
+    
+    @staticmethod
+    def read_table(table) -> Dict[str, str]:
+        """
+        Read a two-column label/value table into a dictionary.
+        
+        One selector query finds the rows; each row's cells are its direct
+        children, so no selector has to be compiled and matched per row.
+        
+        Args:
+            table: selectolax node of the <table>
+        
+        Returns:
+            Dictionary of {label: value}
+        """
+        table_data = {}
+        for row in table.css('tr'):
+            cells = [cell for cell in row.iter() if cell.tag in ('td', 'th')]
+            
+            # Each row should have 2 cells: label and value
+            if len(cells) >= 2:
+                table_data[cells[0].text(strip=True)] = cells[1].text(strip=True)
+        
+        return table_data
+    
+    def _parse_shoprite_details(self, tree: LexborHTMLParser, product: Dict):
+        """Fill in brand, barcode, weight and dimensions from the Shoprite information table."""
+        table_data = {}
+        try:
+            table_selector = 'table.pdp__product-information'
+            # Find the table
+            table = tree.css_first(table_selector)
+            if table is None:
+                self.logger.warning(f"Table not found with selector: {table_selector}")
+                return
+            
+            table_data = self.read_table(table)
+            self.logger.info(f"Extracted {len(table_data)} fields from table")
+            
+        except Exception as e:
+            self.logger.error(f"Error extracting table data: {e}")
 
-                # extract data from the table
-                if table_data:
-                    product['brand'] = table_data.get('Product Brand', product['brand'])
-                    product['barcode'] = table_data.get('Main Barcode', product['barcode'])
-                    product['unit_of_measure'] = table_data.get('Unit of Measure', product['unit_of_measure'])
-                    
-                    # Extract weight from "Product Weight" or "Product Volume" field (whichever is populated)
-                    weight_str = table_data.get('Product Weight', '') or table_data.get('Product Volume', '')
-                    if weight_str:
-                        product['size_weight_volume'] = weight_str
-                        # Parse weight if it's in format like "5kg", "500g", "1l", "500ml"
-                        weight_match = re.search(r'([\d.]+)\s*(kg|g|l|ml)', weight_str.lower())
-                        if weight_match:
-                            product['net_weight'] = f"{weight_match.group(1)} {weight_match.group(2)}"
-                            # Get the unit of measure if there is a weight
-                            unit = weight_match.group(2)
-                            if unit in ['kg', 'g']:
-                                product['unit_of_measure'] = 'kg'
-                            elif unit in ['l', 'ml']:
-                                product['unit_of_measure'] = 'L'
+        # extract data from the table
+        if table_data:
+            product['brand'] = table_data.get('Product Brand', product['brand'])
+            product['barcode'] = table_data.get('Main Barcode', product['barcode'])
+            product['unit_of_measure'] = table_data.get('Unit of Measure', product['unit_of_measure'])
+            
+            # Extract weight from "Product Weight" or "Product Volume" field (whichever is populated)
+            weight_str = table_data.get('Product Weight', '') or table_data.get('Product Volume', '')
+            if weight_str:
+                product['size_weight_volume'] = weight_str
+                # Parse weight if it's in format like "5kg", "500g", "1l", "500ml"
+                weight_match = _WEIGHT_RE.search(weight_str.lower())
+                if weight_match:
+                    product['net_weight'] = f"{weight_match.group(1)} {weight_match.group(2)}"
+                    # Get the unit of measure if there is a weight
+                    unit = weight_match.group(2)
+                    if unit in ['kg', 'g']:
+                        product['unit_of_measure'] = 'kg'
+                    elif unit in ['l', 'ml']:
+                        product['unit_of_measure'] = 'L'
+            
+            # Extract dimensions (width, height, depth/length) - only if present
+            width_str = table_data.get('Product Width (mm)', '')
+            if width_str:
+                product['width'] = width_str
+            
+            height_str = table_data.get('Product Height (mm)', '')
+            if height_str:
+                product['height'] = height_str
+            
+            # Try both "Product Depth" and "Product Length" 
+            depth_str = table_data.get('Product Depth (mm)', '') or table_data.get('Product Length (mm)', '')
+            if depth_str:
+                product['depth'] = depth_str
+                product['length'] = depth_str  # Use same value for both
+            
+            # Extract gross weight if present
+            gross_weight_str = table_data.get('Product Gross Weight (g)', '')
+            if gross_weight_str:
+                product['gross_weight'] = gross_weight_str
+    
+    def _parse_checkers_details(self, tree: LexborHTMLParser, product: Dict):
+        """Fill in brand and barcode from the Checkers specifications table, and size from the name."""
+        table_data = {}
+        try:
+            table_selector = 'table.product-specifications_table__gM398'
+            # Find the table
+            table = tree.css_first(table_selector)
+            if table is None:
+                self.logger.warning(f"Table not found with selector: {table_selector}")
+            else:
+                table_data = self.read_table(table)
+                self.logger.info(f"Extracted {len(table_data)} fields from Checkers table")
+            
+        except Exception as e:
+            self.logger.error(f"Error extracting Checkers table data: {e}")
+
+        # Extract data from the table
+        if table_data:
+            # Extract brand from "Sub Brand" field
+            product['brand'] = table_data.get('Sub Brand', None)
+            
+            # Extract other fields if available
+            product['barcode'] = table_data.get('Barcode', product['barcode'])
+        
+        # Extract weight and unit from product name (e.g., "800g" or "5 x 55ml" in title)
+        if product['product_name']:
+            # First try to match pattern like "5 x 55ml" (quantity x unit_size)
+            multi_pack_match = _MULTI_PACK_IN_NAME_RE.search(product['product_name'])
+            
+            if multi_pack_match:
+                # Calculate total volume/weight: quantity * unit_size
+                quantity = float(multi_pack_match.group(1))
+                unit_size = float(multi_pack_match.group(2))
+                size_unit = multi_pack_match.group(3).lower()
+                
+                total_size = quantity * unit_size
+                
+                product['size_weight_volume'] = f"{total_size}{size_unit}"
+                product['net_weight'] = f"{total_size} {size_unit}"
+                
+                self.logger.debug(f"Multi-pack detected: {quantity} x {unit_size}{size_unit} = {total_size}{size_unit}")
+                
+                # Set unit of measure
+                if size_unit in ['kg', 'g']:
+                    product['unit_of_measure'] = 'kg'
+                elif size_unit in ['l', 'ml']:
+                    product['unit_of_measure'] = 'L'
+            else:
+                # Try single measurement pattern (e.g., "800g")
+                size_match = _SIZE_IN_NAME_RE.search(product['product_name'])
+                if size_match:
+                    size_value = size_match.group(1)
+                    size_unit = size_match.group(2).lower()
                     
-                    # Extract dimensions (width, height, depth/length) - only if present
-                    width_str = table_data.get('Product Width (mm)', '')
-                    if width_str:
-                        product['width'] = width_str
+                    product['size_weight_volume'] = f"{size_value}{size_unit}"
+                    product['net_weight'] = f"{size_value} {size_unit}"
                     
-                    height_str = table_data.get('Product Height (mm)', '')
-                    if height_str:
-                        product['height'] = height_str
+                    # Set unit of measure
+                    if size_unit in ['kg', 'g']:
+                        product['unit_of_measure'] = 'kg'
+                    elif size_unit in ['l', 'ml']:
+                        product['unit_of_measure'] = 'L'
+                else:
+                    # Default to EA if no weight found
+                    product['unit_of_measure'] = 'EA'
+    
+    def _parse_picknpay_details(self, tree: LexborHTMLParser, product: Dict):
+        """Fill in barcode and description from the PicknPay detail headings, and size from the name."""
+        try:
+            # Headings are siblings, each followed by its section's text. Walk each
+            # heading container once rather than scanning siblings from every heading
+            heading_parents = {}
+            for span in tree.css('span.product-details-heading'):
+                if span.parent is not None:
+                    heading_parents[span.parent.mem_id] = span.parent
+            
+            sections = []
+            for parent in heading_parents.values():
+                content_parts = None
+                br_count = 0
+                
+                for node in parent.iter(include_text=True):
+                    # Another span with product-details-heading starts the next section
+                    if node.tag == 'span' and 'product-details-heading' in (node.attributes.get('class') or '').split():
+                        # Get the section title from the h3 inside the span
+                        h3 = node.css_first('h3')
+                        content_parts = None
+                        if h3 is not None:
+                            content_parts = []
+                            sections.append((h3.text(strip=True), content_parts))
+                        br_count = 0
+                        continue
                     
-                    # Try both "Product Depth" and "Product Length" 
-                    depth_str = table_data.get('Product Depth (mm)', '') or table_data.get('Product Length (mm)', '')
-                    if depth_str:
-                        product['depth'] = depth_str
-                        product['length'] = depth_str  # Use same value for both
+                    # Outside a section (before the first heading or after a double br)
+                    if content_parts is None:
+                        continue
                     
-                    # Extract gross weight if present
-                    gross_weight_str = table_data.get('Product Gross Weight (g)', '')
-                    if gross_weight_str:
-                        product['gross_weight'] = gross_weight_str
-            
-            # The product information for Checkers is in a table
-            elif self.retailer_name == 'Checkers':
-                table_data = {}
-                try:
-                    table_selector = 'table.product-specifications_table__gM398'
-                    # Find the table
-                    table = soup.select_one(table_selector)
-                    if not table:
-                        self.logger.warning(f"Table not found with selector: {table_selector}")
+                    # Count br tags to detect double br separator
+                    if node.tag == 'br':
+                        br_count += 1
+                        if br_count >= 2:
+                            content_parts = None
                     else:
-                        # Extract all rows
-                        rows = table.find_all('tr')
-                        
-                        for row in rows:
-                            cells = row.find_all(['td', 'th'])
-                            
-                            # Each row should have 2 cells: label and value
-                            if len(cells) >= 2:
-                                label = cells[0].get_text(strip=True)
-                                value = cells[1].get_text(strip=True)
-                                
-                                # Store with cleaned label as key
-                                table_data[label] = value
-                        
-                        self.logger.info(f"Extracted {len(table_data)} fields from Checkers table")
-                    
-                except Exception as e:
-                    self.logger.error(f"Error extracting Checkers table data: {e}")
-
-                # Extract data from the table
-                if table_data:
-                    # Extract brand from "Sub Brand" field
-                    product['brand'] = table_data.get('Sub Brand', None)
-                    
-                    # Extract other fields if available
-                    product['barcode'] = table_data.get('Barcode', product['barcode'])
+                        # Reset br count if we hit a non-br element or text node
+                        br_count = 0
+                        # Get text from this node
+                        text = node.text(strip=True)
+                        if text:
+                            content_parts.append(text)
+            
+            # Store the content under the heading
+            product_info = {}
+            for section_title, content_parts in sections:
+                if content_parts:
+                    product_info[section_title] = ' '.join(content_parts)
+                    self.logger.debug(f"Section '{section_title}': {content_parts[0][:50]}...")
+            
+            self.logger.info(f"Extracted {len(product_info)} sections from PicknPay product details")
+            if product_info:
+                self.logger.info(f"Section titles found: {list(product_info.keys())}")
+            
+            # Extract relevant fields
+            if product_info:
+                # Barcode section
+                barcode_text = product_info.get('Barcode', '')
+                if barcode_text:
+                    product['barcode'] = barcode_text
                 
-                # Extract weight and unit from product name (e.g., "800g" or "5 x 55ml" in title)
+                # Description section
+                description_text = product_info.get('Description', '')
+                if description_text and not product['description']:
+                    product['description'] = description_text
+                
+                # Try to extract size/weight from product name (e.g., "1kg" or "6 x 440ml" in title)
                 if product['product_name']:
-                    # First try to match pattern like "5 x 55ml" (quantity x unit_size)
-                    multi_pack_match = re.search(r'(\d+)\s*x\s*(\d+(?:\.\d+)?)\s*(kg|g|l|ml)\b', product['product_name'], re.IGNORECASE)
+                    # First try to match pattern like "6 x 440ml" (quantity x unit_size)
+                    multi_pack_match = _MULTI_PACK_IN_NAME_RE.search(product['product_name'])
                     
                     if multi_pack_match:
                         # Calculate total volume/weight: quantity * unit_size
@@ -549,204 +962,178 @@ class UniversalScraper:
                         
                         self.logger.debug(f"Multi-pack detected: {quantity} x {unit_size}{size_unit} = {total_size}{size_unit}")
                         
-                        # Set unit of measure
+                        # Get the unit of measure
                         if size_unit in ['kg', 'g']:
                             product['unit_of_measure'] = 'kg'
                         elif size_unit in ['l', 'ml']:
                             product['unit_of_measure'] = 'L'
                     else:
-                        # Try single measurement pattern (e.g., "800g")
-                        size_match = re.search(r'(\d+(?:\.\d+)?)\s*(kg|g|l|ml)\b', product['product_name'], re.IGNORECASE)
+                        # Try single measurement pattern (e.g., "1kg")
+                        size_match = _SIZE_IN_NAME_RE.search(product['product_name'])
                         if size_match:
-                            size_value = size_match.group(1)
-                            size_unit = size_match.group(2).lower()
-                            
-                            product['size_weight_volume'] = f"{size_value}{size_unit}"
-                            product['net_weight'] = f"{size_value} {size_unit}"
-                            
-                            # Set unit of measure
-                            if size_unit in ['kg', 'g']:
+                            product['size_weight_volume'] = f"{size_match.group(1)}{size_match.group(2)}"
+                            product['net_weight'] = f"{size_match.group(1)} {size_match.group(2)}"
+                            # Get the unit of measure
+                            unit = size_match.group(2)
+                            if unit in ['kg', 'g']:
                                 product['unit_of_measure'] = 'kg'
-                            elif size_unit in ['l', 'ml']:
+                            elif unit in ['L', 'ml']:
                                 product['unit_of_measure'] = 'L'
-                        else:
-                            # Default to EA if no weight found
+                        else: 
                             product['unit_of_measure'] = 'EA'
+        
+        except Exception as e:
+            self.logger.error(f"Error extracting PicknPay product details: {e}")
+    
+    def _parse_default_details(self, tree: LexborHTMLParser, product: Dict):
+        """Retailers without extra detail parsing; only the configured selectors are used."""
+        # product['brand'] = self.extract_text(
+        #     tree, self.selectors['brand']
+        # )
+        
+        # product['size_weight_volume'] = self.extract_text(
+        #     tree, self.selectors['size']
+        # )
+        
+        # product['barcode'] = self.extract_text(
+        #     tree, self.selectors['barcode']
+        # )
+        pass
+    
+    def scrape_product(self, product_url: str, fetch_product: Callable[[str], Optional[Dict]]) -> Optional[Dict]:
+        """
+        Scrape one product, reusing its checkpointed data if there is any.
+        
+        Args:
+            product_url: Product page URL
+            fetch_product: Function that fetches and parses the product page
             
-            # The product information for PicknPay is in h3 headings with content following
-            elif self.retailer_name == 'PicknPay':
+        Returns:
+            Product data, or None if the page could not be scraped
+        """
+        product_data = self.checkpointed_products.get(product_url)
+        if product_data is not None:
+            return product_data
+        
+        product_data = fetch_product(product_url)
+        if product_data and self.checkpoint:
+            self.checkpoint.save(self.retailer_name, product_data)
+        
+        return product_data
+    
+    def scrape_products_browser(self, product_urls: List[str], all_products: List[Dict],
+                                max_items: Optional[int] = None) -> bool:
+        """
+        Scrape product pages in the browser, browser_tabs pages at a time.
+        
+        Each batch starts navigating every tab before waiting on any of them,
+        so the pages load in parallel while the sync API waits on one. Each
+        tab's navigation is still followed by a random delay. With max_items,
+        batches are sized to what is still needed, so failed pages are
+        replaced by the next ones.
+        
+        Args:
+            product_urls: Product page URLs to scrape
+            all_products: List the scraped products are appended to
+            max_items: Maximum number of products to scrape (None = all products)
+            
+        Returns:
+            True if the max_items limit has been reached
+        """
+        pending_urls = iter(product_urls)
+        
+        while not (max_items and len(all_products) >= max_items):
+            batch_size = len(self.tabs)
+            if max_items:
+                batch_size = min(batch_size, max_items - len(all_products))
+            batch = list(islice(pending_urls, batch_size))
+            if not batch:
+                break
+            self.seen_product_urls.update(batch)
+            
+            # Start loading every product that isn't already checkpointed,
+            # spacing the requests out as one tab at a time would
+            loading = {}
+            for tab, product_url in zip(self.tabs, batch):
+                if product_url not in self.checkpointed_products and self.start_navigation(tab, product_url):
+                    loading[product_url] = tab
+                    self.wait_random()
+            
+            def fetch_product(product_url: str) -> Optional[Dict]:
+                tab = loading.get(product_url)
+                return self.extract_product_details(product_url, tab) if tab else None
+            
+            for product_url in batch:
                 try:
-                    # Find all span elements with class 'product-details-heading'
-                    heading_spans = soup.find_all('span', class_='product-details-heading')
-                    
-                    product_info = {}
-                    for span in heading_spans:
-                        # Get the section title from the h3 inside the span
-                        h3 = span.find('h3')
-                        if not h3:
-                            continue
-                        
-                        section_title = h3.get_text(strip=True)
-                        
-                        # Collect text from siblings until we hit another span or double br
-                        content_parts = []
-                        current = span.next_sibling
-                        br_count = 0
-                        
-                        while current:
-                            # If we hit another span with product-details-heading, stop
-                            if hasattr(current, 'name'):
-                                if current.name == 'span' and 'product-details-heading' in current.get('class', []):
-                                    break
-                                
-                                # Count br tags to detect double br separator
-                                if current.name == 'br':
-                                    br_count += 1
-                                    if br_count >= 2:
-                                        break
-                                else:
-                                    # Reset br count if we hit non-br element
-                                    br_count = 0
-                                    # Get text from this element
-                                    text = current.get_text(strip=True)
-                                    if text:
-                                        content_parts.append(text)
-                            elif isinstance(current, str):
-                                # Direct text node
-                                text = current.strip()
-                                if text:
-                                    content_parts.append(text)
-                                    br_count = 0  # Reset br count
-                            
-                            current = current.next_sibling
-                        
-                        # Store the content under the heading
-                        if content_parts:
-                            product_info[section_title] = ' '.join(content_parts)
-                            self.logger.debug(f"Section '{section_title}': {content_parts[0][:50]}...")
-                    
-                    self.logger.info(f"Extracted {len(product_info)} sections from PicknPay product details")
-                    if product_info:
-                        self.logger.info(f"Section titles found: {list(product_info.keys())}")
-                    
-                    # Extract relevant fields
-                    if product_info:
-                        # Barcode section
-                        barcode_text = product_info.get('Barcode', '')
-                        if barcode_text:
-                            product['barcode'] = barcode_text
-                        
-                        # Description section
-                        description_text = product_info.get('Description', '')
-                        if description_text and not product['description']:
-                            product['description'] = description_text
-                        
-                        # Try to extract size/weight from product name (e.g., "1kg" or "6 x 440ml" in title)
-                        if product['product_name']:
-                            # First try to match pattern like "6 x 440ml" (quantity x unit_size)
-                            multi_pack_match = re.search(r'(\d+)\s*x\s*(\d+(?:\.\d+)?)\s*(kg|g|l|ml)\b', product['product_name'], re.IGNORECASE)
-                            
-                            if multi_pack_match:
-                                # Calculate total volume/weight: quantity * unit_size
-                                quantity = float(multi_pack_match.group(1))
-                                unit_size = float(multi_pack_match.group(2))
-                                size_unit = multi_pack_match.group(3).lower()
-                                
-                                total_size = quantity * unit_size
-                                
-                                product['size_weight_volume'] = f"{total_size}{size_unit}"
-                                product['net_weight'] = f"{total_size} {size_unit}"
-                                
-                                self.logger.debug(f"Multi-pack detected: {quantity} x {unit_size}{size_unit} = {total_size}{size_unit}")
-                                
-                                # Get the unit of measure
-                                if size_unit in ['kg', 'g']:
-                                    product['unit_of_measure'] = 'kg'
-                                elif size_unit in ['l', 'ml']:
-                                    product['unit_of_measure'] = 'L'
-                            else:
-                                # Try single measurement pattern (e.g., "1kg")
-                                size_match = re.search(r'(\d+(?:\.\d+)?)\s*(kg|g|l|ml)\b', product['product_name'], re.IGNORECASE)
-                                if size_match:
-                                    product['size_weight_volume'] = f"{size_match.group(1)}{size_match.group(2)}"
-                                    product['net_weight'] = f"{size_match.group(1)} {size_match.group(2)}"
-                                    # Get the unit of measure
-                                    unit = size_match.group(2)
-                                    if unit in ['kg', 'g']:
-                                        product['unit_of_measure'] = 'kg'
-                                    elif unit in ['L', 'ml']:
-                                        product['unit_of_measure'] = 'L'
-                                else: 
-                                    product['unit_of_measure'] = 'EA'
-                
+                    product_data = self.scrape_product(product_url, fetch_product)
+                    if product_data:
+                        all_products.append(product_data)
+                        self.logger.info(f"Scraped: {product_data.get('product_name', 'Unknown')} ({len(all_products)}/{max_items or 'unlimited'})")
                 except Exception as e:
-                    self.logger.error(f"Error extracting PicknPay product details: {e}")
+                    self.logger.error(f"Error scraping product {product_url}: {e}")
+        
+        if max_items and len(all_products) >= max_items:
+            self.logger.info(f"Reached max_items limit of {max_items}. Stopping scrape.")
+            return True
+        
+        return False
+    
+    def scrape_products_http(self, product_urls: List[str], all_products: List[Dict],
+                             max_items: Optional[int] = None) -> bool:
+        """
+        Fetch and parse product pages concurrently over HTTP.
+        
+        Up to http_workers pages are in flight at once; each worker still waits
+        a random delay after its request. With max_items, no more pages are
+        queued than could still be needed, and a failed page is replaced by
+        the next one.
+        
+        Args:
+            product_urls: Product page URLs to scrape
+            all_products: List the scraped products are appended to
+            max_items: Maximum number of products to scrape (None = all products)
             
-            else:
-                # product['brand'] = self.extract_text(
-                #     soup, self.config['selectors']['brand']
-                # )
+        Returns:
+            True if the max_items limit has been reached
+        """
+        def fetch_product(product_url: str) -> Optional[Dict]:
+            product_html = self.fetch_html(product_url)
+            if not product_html:
+                return None
+            return self.parse_product_page(product_html, product_url)
+        
+        pending_urls = iter(product_urls)
+        in_flight = deque()
+        
+        with ThreadPoolExecutor(max_workers=self.http_workers) as executor:
+            while True:
+                # Top up the workers, counting pages in flight against max_items
+                while len(in_flight) < self.http_workers and not (
+                        max_items and len(all_products) + len(in_flight) >= max_items):
+                    product_url = next(pending_urls, None)
+                    if product_url is None:
+                        break
+                    self.seen_product_urls.add(product_url)
+                    in_flight.append((product_url, executor.submit(self.scrape_product, product_url, fetch_product)))
                 
-                # product['size_weight_volume'] = self.extract_text(
-                #     soup, self.config['selectors']['size']
-                # )
+                if not in_flight:
+                    break
                 
-                # product['barcode'] = self.extract_text(
-                #     soup, self.config['selectors']['barcode']
-                # )
-                pass
-            
-            product['price'] = self.extract_price(soup)
-            
-            # Extract product ID from URL (retailer-specific patterns)
-            if self.retailer_name == 'Checkers':
-                # Checkers format: .../product-name-10375535EA
-                id_match = re.search(r'-(\d{8})(?:EA|KG|L)?$', product_url)
-                if id_match:
-                    product['product_id'] = id_match.group(1)
-            else:
-                # Generic pattern for other retailers
-                id_match = re.search(r'/(\d{6,})', product_url)
-                if id_match:
-                    product['product_id'] = id_match.group(1)
-
-            # Calculate the price per unit (price per kg or price per liter)
-            if product['price']:
-                # If unit of measure is EA (Each), price per unit is just the price
-                if product['unit_of_measure'] == 'EA':
-                    product['price_per_unit'] = product['price']
-                # Otherwise calculate based on size/weight/volume
-                elif product['size_weight_volume']:
-                    try:
-                        # Parse the size/weight/volume to get number and unit
-                        size_match = re.search(r'([\d.]+)\s*(kg|g|l|ml)', product['size_weight_volume'], re.IGNORECASE)
-                        if size_match:
-                            amount = float(size_match.group(1))
-                            unit = size_match.group(2).lower()
-                            price = float(product['price'])
-                            
-                            # Normalize to kg or L
-                            if unit == 'g':
-                                normalized_amount = amount / 1000  # Convert g to kg
-                            elif unit == 'ml':
-                                normalized_amount = amount / 1000  # Convert ml to L
-                            else:
-                                normalized_amount = amount  # Already kg or L
-                            
-                            # Calculate price per kg or per L
-                            if normalized_amount > 0:
-                                price_per_unit = price / normalized_amount
-                                product['price_per_unit'] = f"{price_per_unit:.2f}"
-                                self.logger.debug(f"Calculated price_per_unit: R{price_per_unit:.2f} per {'kg' if unit in ['kg', 'g'] else 'L'}")
-                    
-                    except (ValueError, ZeroDivisionError) as e:
-                        self.logger.warning(f"Could not calculate price_per_unit: {e}")
-            self.logger.info('Product extraction complete')
-        except Exception as e:
-            self.logger.error(f"Error extracting details for {product_url}: {e}")
-            return None
+                # Oldest first, so products keep their page order
+                product_url, future = in_flight.popleft()
+                try:
+                    product_data = future.result()
+                    if product_data:
+                        all_products.append(product_data)
+                        self.logger.info(f"Scraped: {product_data.get('product_name', 'Unknown')} ({len(all_products)}/{max_items or 'unlimited'})")
+                except Exception as e:
+                    self.logger.error(f"Error scraping product {product_url}: {e}")
         
-        return product
+        if max_items and len(all_products) >= max_items:
+            self.logger.info(f"Reached max_items limit of {max_items}. Stopping scrape.")
+            return True
+        
+        return False
     
     def scrape_category(self, max_pages: Optional[int] = None, max_items: Optional[int] = None) -> List[Dict]:
         """
@@ -760,7 +1147,8 @@ class UniversalScraper:
         
         category_url = self.config['category_url']
         
-        if not self.safe_navigate(category_url):
+        # Checkers' landing page lists subsections rather than products
+        if not self.safe_navigate(category_url, self.selectors.get('section_header', self.selectors['product_card'])):
             self.logger.error("Failed to navigate to category page")
             return all_products
         
@@ -770,26 +1158,111 @@ class UniversalScraper:
             self.logger.info(f"Scraping page {page_num}/{len(page_urls)}")
             
             if page_url != self.page.url:
-                if not self.safe_navigate(page_url):
+                if not self.safe_navigate(page_url, self.selectors['product_card']):
                     continue
             
-            product_urls = self.extract_product_urls()
-            self.logger.info(f"Found {len(product_urls)} products on page {page_num}")
+            product_urls = self.filter_new_product_urls(self.extract_product_urls())
+            self.logger.info(f"Found {len(product_urls)} new products on page {page_num}")
             
-            for product_url in product_urls:
-                # Check if we've reached max_items limit
-                if max_items and len(all_products) >= max_items:
-                    self.logger.info(f"Reached max_items limit of {max_items}. Stopping scrape.")
+            # Hybrid mode: the browser is only needed for the listing pages
+            if self.scrape_mode == 'hybrid':
+                if self.scrape_products_http(product_urls, all_products, max_items):
                     return all_products
-                
-                try:
-                    product_data = self.extract_product_details(product_url)
-                    if product_data:
-                        all_products.append(product_data)
-                        self.logger.info(f"Scraped: {product_data.get('product_name', 'Unknown')} ({len(all_products)}/{max_items or 'unlimited'})")
-                except Exception as e:
-                    self.logger.error(f"Error scraping product {product_url}: {e}")
-                    continue
+                continue
+            
+            if self.scrape_products_browser(product_urls, all_products, max_items):
+                return all_products
+        
+        return all_products
+    
+    def iter_listing_pages_http(self, max_pages: Optional[int] = None) -> Iterator[Tuple[int, str, LexborHTMLParser]]:
+        """
+        Fetch category listing pages over plain HTTP.
+        
+        With a 'page_url_template' in the config, pages are fetched http_workers
+        at a time until one comes back empty; otherwise the next_button link's
+        href is followed one page at a time.
+        
+        Args:
+            max_pages: Maximum number of pages to fetch (None = all pages)
+            
+        Yields:
+            Tuple of (page number, page URL, parsed page)
+        """
+        page_template = self.config.get('page_url_template')
+        
+        if page_template:
+            page_num = 1
+            with ThreadPoolExecutor(max_workers=self.http_workers) as executor:
+                while not max_pages or page_num <= max_pages:
+                    last_page = page_num + self.http_workers - 1
+                    if max_pages:
+                        last_page = min(last_page, max_pages)
+                    
+                    page_nums = range(page_num, last_page + 1)
+                    page_urls = [page_template.format(page=n) for n in page_nums]
+                    
+                    for n, page_url, listing_html in zip(page_nums, page_urls, executor.map(self.fetch_html, page_urls)):
+                        if not listing_html:
+                            return
+                        
+                        tree = LexborHTMLParser(listing_html)
+                        
+                        # Past the last page: the listing has no products
+                        if tree.css_first(self.selectors['product_link']) is None:
+                            return
+                        
+                        yield n, page_url, tree
+                    
+                    page_num = last_page + 1
+            return
+        
+        page_url = self.config['category_url']
+        page_num = 0
+        
+        while page_url:
+            page_num += 1
+            if max_pages and page_num > max_pages:
+                break
+            
+            listing_html = self.fetch_html(page_url)
+            if not listing_html:
+                break
+            
+            tree = LexborHTMLParser(listing_html)
+            yield page_num, page_url, tree
+            
+            # Follow the next page link, if any
+            next_link = tree.css_first(self.selectors['next_button'])
+            next_href = next_link.attributes.get('href') if next_link is not None else None
+            page_url = urljoin(page_url, next_href) if next_href else None
+    
+    def scrape_category_http(self, max_pages: Optional[int] = None, max_items: Optional[int] = None) -> List[Dict]:
+        """
+        Scrape all products from category over plain HTTP (no browser).
+        
+        Only suitable for retailers whose listing and product pages are
+        server-rendered; see iter_listing_pages_http for pagination.
+        
+        Args:
+            max_pages: Maximum number of pages to scrape (None = all pages)
+            max_items: Maximum number of products to scrape (None = all products)
+        """
+        all_products = []
+        
+        for page_num, page_url, tree in self.iter_listing_pages_http(max_pages):
+            self.logger.info(f"Scraping page {page_num}: {page_url}")
+            
+            product_urls = []
+            for link in tree.css(self.selectors['product_link']):
+                href = link.attributes.get('href')
+                if href:
+                    product_urls.append(absolute_url(page_url, href))
+            product_urls = self.filter_new_product_urls(product_urls)
+            self.logger.info(f"Found {len(product_urls)} new products on page {page_num}")
+            
+            if self.scrape_products_http(product_urls, all_products, max_items):
+                return all_products
         
         return all_products
     
@@ -804,10 +1277,19 @@ class UniversalScraper:
         products = []
         
         try:
-            self.start_browser()
-            self.logger.info(f"Starting scrape for {self.retailer_name}")
+            self.logger.info(f"Starting scrape for {self.retailer_name} (mode: {self.scrape_mode})")
             
-            products = self.scrape_category(max_pages, max_items)
+            if self.checkpoint:
+                self.checkpointed_products = self.checkpoint.load(self.retailer_name)
+            
+            if self.scrape_mode == 'http':
+                self.start_session()
+                products = self.scrape_category_http(max_pages, max_items)
+            else:
+                if self.scrape_mode == 'hybrid':
+                    self.start_session()
+                self.start_browser()
+                products = self.scrape_category(max_pages, max_items)
             
             self.logger.info(f"Scraping complete. Total products: {len(products)}")
             
@@ -816,6 +1298,8 @@ class UniversalScraper:
             raise
         
         finally:
-            self.close_browser()
+            self.close_session()
+            if self.scrape_mode != 'http':
+                self.close_browser()
         
         return products
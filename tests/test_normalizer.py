@@ -0,0 +1,52 @@
+"""Column-wise normalizer helpers must match their per-value counterparts."""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from utils.normalizer import DataNormalizer
+
+
+# Mixed object-dtype column, as a raw file or a hand-built DataFrame can hold
+MIXED_VALUES = [
+    None, np.nan, '', '   ', 'None', 'nan', 'NaN',
+    0, 0.0, False, True, 7, 12.5,
+    '0', '0.00', '12', ' 3.5 ', 'R49.99', 'R 1,29', 'abc',
+    '  Fish   fingers \n 400g ', 'McCain 1.5kg',
+]
+
+
+def _same(expected, actual) -> bool:
+    if expected is None:
+        return actual is None or (isinstance(actual, float) and math.isnan(actual))
+    return expected == actual
+
+
+def test_clean_texts_matches_clean_text_on_mixed_objects():
+    texts = pd.Series(MIXED_VALUES, dtype=object)
+    
+    cleaned = DataNormalizer.clean_texts(texts).tolist()
+    
+    for value, actual in zip(MIXED_VALUES, cleaned):
+        assert _same(DataNormalizer.clean_text(value), actual), value
+
+
+def test_clean_prices_matches_clean_price_on_mixed_objects():
+    # True is the one documented difference (clean_price reads it as 1.0)
+    values = [value for value in MIXED_VALUES if value is not True]
+    prices = pd.Series(values, dtype=object)
+    
+    cleaned = DataNormalizer.clean_prices(prices).tolist()
+    
+    for value, actual in zip(values, cleaned):
+        assert _same(DataNormalizer.clean_price(value), actual), value
+
+
+def test_clean_prices_keeps_the_text_zero_fill():
+    prices = pd.Series(['0.00', 0, 0.0], dtype=object)
+    
+    cleaned = DataNormalizer.clean_prices(prices).tolist()
+    
+    assert cleaned[0] == 0.0
+    assert all(math.isnan(value) for value in cleaned[1:])
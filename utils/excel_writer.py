@@ -0,0 +1,41 @@
+"""
+Excel Writer
+------------
+Streams rows into a single-sheet workbook with xlsxwriter.
+"""
+
+from pathlib import Path
+from typing import Iterable, Sequence, Union
+import xlsxwriter
+
+
+# Output file buffer (1 MiB)
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def write_rows(output_path: Union[str, Path], columns: Sequence[str], rows: Iterable[Sequence]):
+    """
+    Write a header and rows to an Excel file.
+    
+    Uses constant_memory mode, so each row is flushed to disk as soon as it is
+    written and memory stays flat regardless of row count. None values become
+    empty cells.
+    
+    Args:
+        output_path: Destination .xlsx path
+        columns: Header row
+        rows: Data rows, in column order
+    """
+    # The zip container is written in many small chunks; a large buffer
+    # turns them into a few big writes
+    with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as output_file:
+        workbook = xlsxwriter.Workbook(output_file, {'constant_memory': True})
+        try:
+            worksheet = workbook.add_worksheet()
+            header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+            worksheet.write_row(0, 0, columns, header_format)
+            
+            for row_num, row in enumerate(rows, 1):
+                worksheet.write_row(row_num, 0, row)
+        finally:
+            workbook.close()
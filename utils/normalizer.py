@@ -5,7 +5,30 @@ Cleans and standardizes scraped product data for comparison.
 """
 
 import re
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Iterable, List, Optional, Dict
+import numpy as np
+import pandas as pd
+
+
+# Patterns used per product, compiled once at import. _NAME_SIZE_RE strips
+# pack sizes ("6 x 440ml") and plain sizes ("1.5kg") in a single pass
+_NAME_SIZE_RE = re.compile(r'\d+\s*x\s*\d+\s*(?:ml|g|kg|l)|\d+(?:\.\d+)?\s*(?:ml|g|kg|l|mm)')
+_WHITESPACE_RE = re.compile(r'\s+')
+_WEIGHT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(kg|g|l|ml)')
+
+# Factor from each _WEIGHT_RE unit to the base unit (g or ml)
+_UNIT_TO_BASE = {'kg': 1000.0, 'g': 1.0, 'l': 1000.0, 'ml': 1.0}
+
+# Text the clean_* and parse_* methods treat as missing
+_MISSING_TEXT = frozenset({'none', 'nan', ''})
+
+# Text columns normalize_product passes through clean_text
+_TEXT_COLUMNS = ['product_name', 'brand', 'size_weight_volume', 'unit_of_measure', 'retailer', 'product_url']
+
+# Price pattern shared by clean_price and clean_prices (the group is for
+# str.extract). Prices are ASCII digits, so skip Unicode digit matching
+_PRICE_RE = re.compile(r'(\d+[.,]\d{2})', re.ASCII)
 
 
 class DataNormalizer:
@@ -16,19 +39,50 @@ class DataNormalizer:
     @staticmethod
     def clean_text(text: Optional[str]) -> Optional[str]:
         """Clean and normalize text fields."""
-        if not text or str(text).lower() in ['none', 'nan', '']:
+        if not text:
             return None
         
-        text = str(text).strip()
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        # Scraped fields are almost always str already; only coerce the rest
+        if type(text) is not str:
+            text = str(text)
+        if text.lower() in _MISSING_TEXT:
+            return None
+        
+        # Fast path for already-clean text (most product names). ' ' is the only
+        # whitespace isprintable() allows, so there is nothing to strip or collapse
+        if text.isprintable() and '  ' not in text and text[0] != ' ' and text[-1] != ' ':
+            return text
+        
+        # Strip and collapse whitespace; split() uses the same whitespace as \s
+        text = ' '.join(text.split())
         
         return text if text else None
     
+    @staticmethod
+    def clean_texts(texts: pd.Series) -> pd.Series:
+        """
+        Vectorized clean_text for a whole column.
+        
+        None wherever clean_text would return None, so the result matches
+        applying clean_text to each value, including non-str values in an
+        object column (0 and False are missing, like '' and None).
+        """
+        text = texts.astype(object).astype(str)
+        cleaned = text.str.strip().str.replace(_WHITESPACE_RE, ' ', regex=True)
+        # texts.eq(0) catches the falsy non-str values (0, 0.0, False) before
+        # str() turns them into text
+        missing = texts.isna() | texts.eq(0) | text.str.lower().isin(_MISSING_TEXT) | (cleaned == '')
+        
+        return pd.Series(np.where(missing, None, cleaned), index=texts.index, dtype=object)
+    
     @staticmethod
     def clean_price(price) -> Optional[float]:
         """Extract and clean price value."""
-        if not price or str(price).lower() in ['none', 'nan', '']:
+        if not price:
+            return None
+        
+        price_text = str(price)
+        if price_text.lower() in _MISSING_TEXT:
             return None
         
         # If already a number
@@ -38,7 +92,7 @@ class DataNormalizer:
             pass
         
         # Extract from string
-        price_match = re.search(r'(\d+[.,]\d{2})', str(price))
+        price_match = _PRICE_RE.search(price_text)
         if price_match:
             price_str = price_match.group(1).replace(',', '.')
             try:
@@ -49,6 +103,32 @@ class DataNormalizer:
         return None
     
     @staticmethod
+    def clean_prices(prices: pd.Series) -> pd.Series:
+        """
+        Vectorized clean_price for a whole column.
+        
+        Values that parse as numbers are kept; otherwise the first price-like
+        pattern in the text is used. NaN where no price could be extracted.
+        As in clean_price, a numeric 0 (or False) counts as missing, also in
+        an object column, but the text '0.00' (collect_data's RAW_FILL_VALUES
+        fill for a missing price) parses to 0.0. Unlike clean_price, True in
+        an object column gives NaN rather than 1.0.
+        """
+        if pd.api.types.is_numeric_dtype(prices):
+            # clean_price treats a numeric 0 as missing
+            cleaned = prices.astype('float64')
+            return cleaned.where(cleaned != 0)
+        
+        text = prices.astype(str).str.strip()
+        numeric = pd.to_numeric(text, errors='coerce')
+        extracted = text.str.extract(_PRICE_RE, expand=False).str.replace(',', '.', regex=False)
+        cleaned = numeric.fillna(pd.to_numeric(extracted, errors='coerce')).astype('float64')
+        
+        # Non-str zeros in an object column; the text '0.00' never equals 0
+        return cleaned.where(~prices.eq(0))
+    
+    @staticmethod
+    @lru_cache(maxsize=65536)
     def normalize_product_name(name: str) -> str:
         """
         Normalize product name for comparison.
@@ -59,59 +139,110 @@ class DataNormalizer:
         
         name = str(name).lower().strip()
         
-        # Remove common package indicators
-        name = re.sub(r'\d+\s*x\s*\d+\s*(ml|g|kg|l)', '', name)
-        name = re.sub(r'\d+(?:\.\d+)?\s*(ml|g|kg|l|mm)', '', name)
+        # Remove common package indicators (pack sizes are tried first)
+        name = _NAME_SIZE_RE.sub('', name)
         
         # Remove extra whitespace
-        name = re.sub(r'\s+', ' ', name).strip()
+        name = ' '.join(name.split())
         
         return name
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def parse_weight_volume(text: Optional[str]) -> Optional[float]:
         """
         Parse weight/volume and normalize to base units (g or ml).
-        Returns value in grams or milliliters.
+        Returns value in grams or milliliters. Cached, since the same few
+        sizes repeat across a whole catalogue.
         """
-        if not text or str(text).lower() in ['none', 'nan', '']:
+        if not text:
             return None
         
-        text = str(text).lower().strip()
+        text = str(text).lower()
+        if text in _MISSING_TEXT:
+            return None
         
         # Try to extract number and unit
-        match = re.search(r'(\d+(?:\.\d+)?)\s*(kg|g|l|ml)', text)
+        match = _WEIGHT_RE.search(text)
         if not match:
             return None
         
-        value = float(match.group(1))
-        unit = match.group(2)
+        # Normalize to base units (kg -> g, l -> ml)
+        return float(match.group(1)) * _UNIT_TO_BASE[match.group(2)]
+    
+    @staticmethod
+    def parse_weight_volumes(texts: pd.Series) -> pd.Series:
+        """Vectorized parse_weight_volume for a whole column (NaN where nothing parses)."""
+        parts = texts.astype(object).astype(str).str.lower().str.extract(_WEIGHT_RE)
+        values = pd.to_numeric(parts[0], errors='coerce') * parts[1].map(_UNIT_TO_BASE)
+        
+        return values.where(texts.notna()).astype('float64')
+    
+    @staticmethod
+    def normalize_products(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Normalize every product in a DataFrame, one column at a time.
         
-        # Normalize to base units
-        if unit == 'kg':
-            return value * 1000  # Convert to grams
-        elif unit == 'g':
-            return value
-        elif unit == 'l':
-            return value * 1000  # Convert to milliliters
-        elif unit == 'ml':
-            return value
+        Same fields and values as normalize_product applied row by row. Prices
+        should already have been through clean_prices.
+        """
+        def column(name: str) -> pd.Series:
+            if name in df.columns:
+                return df[name]
+            return pd.Series(None, index=df.index, dtype=object)
         
-        return None
+        texts = {name: DataNormalizer.clean_texts(column(name)) for name in _TEXT_COLUMNS}
+        
+        prices = {
+            name: pd.to_numeric(column(name), errors='coerce')
+            for name in ('price', 'price_per_unit')
+        }
+        
+        normalized = pd.DataFrame({
+            'product_name': texts['product_name'],
+            'brand': texts['brand'],
+            'price': prices['price'],
+            'price_per_unit': prices['price_per_unit'],
+            'size_weight_volume': texts['size_weight_volume'],
+            'normalized_size': DataNormalizer.parse_weight_volumes(column('size_weight_volume')),
+            'unit_of_measure': texts['unit_of_measure'],
+            'retailer': texts['retailer'],
+            'product_url': texts['product_url'],
+        })
+        
+        return normalized.reset_index(drop=True)
     
     @staticmethod
     def normalize_product(product: Dict) -> Dict:
         """
         Normalize a single product for comparison.
         """
-        return {
-            'product_name': DataNormalizer.clean_text(product.get('product_name')),
-            'brand': DataNormalizer.clean_text(product.get('brand')),
-            'price': DataNormalizer.clean_price(product.get('price')),
-            'price_per_unit': DataNormalizer.clean_price(product.get('price_per_unit')),
-            'size_weight_volume': DataNormalizer.clean_text(product.get('size_weight_volume')),
-            'normalized_size': DataNormalizer.parse_weight_volume(product.get('size_weight_volume')),
-            'unit_of_measure': DataNormalizer.clean_text(product.get('unit_of_measure')),
-            'retailer': DataNormalizer.clean_text(product.get('retailer')),
-            'product_url': DataNormalizer.clean_text(product.get('product_url')),
-        }
+        get = product.get
+        return {field: clean(get(source)) for field, source, clean in _PRODUCT_FIELDS}
+    
+    @staticmethod
+    def normalize_batch(products: Iterable[Dict]) -> List[Dict]:
+        """
+        Normalize an iterable of product dicts (normalize_product for each).
+        
+        For a DataFrame, normalize_products is faster.
+        """
+        fields = _PRODUCT_FIELDS
+        return [
+            {field: clean(product.get(source)) for field, source, clean in fields}
+            for product in products
+        ]
+
+
+# (output field, input field, cleaner) for normalize_product, in output order
+_PRODUCT_FIELDS = [
+    ('product_name', 'product_name', DataNormalizer.clean_text),
+    ('brand', 'brand', DataNormalizer.clean_text),
+    ('price', 'price', DataNormalizer.clean_price),
+    ('price_per_unit', 'price_per_unit', DataNormalizer.clean_price),
+    ('size_weight_volume', 'size_weight_volume', DataNormalizer.clean_text),
+    ('normalized_size', 'size_weight_volume', DataNormalizer.parse_weight_volume),
+    ('unit_of_measure', 'unit_of_measure', DataNormalizer.clean_text),
+    ('retailer', 'retailer', DataNormalizer.clean_text),
+    ('product_url', 'product_url', DataNormalizer.clean_text),
+]